@@ -0,0 +1,175 @@
+import io
+import sys
+import json
+import time
+import random
+import timeit
+import argparse
+import platform
+from contextlib import redirect_stdout
+from card_handling import Deck, Hand, FULL_DECK
+from gameplay import Blackjack
+from simulation import Simulator
+
+
+# each benchmark returns the function to time and an optional setup function run before each timing run:
+
+def bench_reinstate_deck():
+    """Rebuilds a full deck of 52 cards."""
+    deck = Deck()
+    return deck.reinstate_deck, None
+
+
+def bench_shuffle_deck():
+    """Shuffles a full deck of 52 cards."""
+    deck = Deck()
+    deck.reinstate_deck()
+    return deck.shuffle_deck, None
+
+
+def bench_deal_card():
+    """Deals a single card from a deck."""
+    deck = Deck()
+
+    def setup():    # enough cards for every deal of a timing run
+        deck.cards = list(FULL_DECK) * 2000
+    return deck.deal_card, setup
+
+
+def bench_draw_card():
+    """Draws a single card from a deck into a hand, with a fresh hand every 3 cards (so hands rarely stay busted)."""
+    deck, hands = Deck(), None
+
+    def setup():    # fresh hands made beforehand, so only draw_card() and next() are timed
+        nonlocal hands
+        deck.cards = list(FULL_DECK) * 2000
+        hands = iter([hand for hand in [Hand() for _ in range(len(deck.cards) // 3)] for _ in range(3)])
+    return lambda: next(hands).draw_card(deck), setup
+
+
+def bench_dealer_draws():
+    """Draws the dealer's cards until the dealer stands, from a fresh deck."""
+    game = Blackjack(10 ** 12, verbose=False)
+
+    def setup():
+        game.deck.cards = list(FULL_DECK) * 5000
+    return lambda: (game.hands["dealer"].reset_hand(), game.dealer_draws()), setup
+
+
+def scripted_game():
+    """Returns a game whose prompts are answered by a script: bet 10 chips and hit below 17."""
+    def script(question):
+        if "bet" in question:
+            return "10"
+        return "h" if game.hands["player"].value < 17 else "s"
+    game = Blackjack(10 ** 12, prompt=script)
+    return game
+
+
+def bench_scripted_round():
+    """Plays a full round with the interactive Blackjack methods, with a scripted player."""
+    game = scripted_game()
+
+    def play_round():   # same flow as main(), with all output discarded (see run_benchmarks())
+        game.handle_bet()
+        game.handle_deck()
+        game.first_deal()
+        game.display_table()
+        busted = False
+        while game.hit_or_stand() == "h":
+            game.hit()
+            game.display_table()
+            busted = game.player_bust()
+            if busted:
+                break
+        if not busted:
+            game.display_table(reveal_dealer=True)
+            game.dealer_draws()
+            if not game.dealer_bust():
+                game.determine_winner()
+    return play_round, None
+
+
+def bench_headless_round():
+    """Plays a full round with the headless Simulator (see simulation.py)."""
+    sim = Simulator(10 ** 12)
+    return sim.play_round, None
+
+
+BENCHMARKS = {     # name: (benchmark, no. of operations per timing run)
+    "Deck.reinstate_deck": (bench_reinstate_deck, 20_000),
+    "Deck.shuffle_deck": (bench_shuffle_deck, 5_000),
+    "Deck.deal_card": (bench_deal_card, 100_000),
+    "Hand.draw_card": (bench_draw_card, 100_000),
+    "Blackjack.dealer_draws": (bench_dealer_draws, 50_000),
+    "round (scripted, stdout stubbed)": (bench_scripted_round, 2_000),
+    "round (headless Simulator)": (bench_headless_round, 5_000),
+}
+
+
+def run_benchmarks(repeat=5, seed=0):
+    """
+    Runs every benchmark repeat times and returns the best time per operation of each, in nanoseconds.
+    The global random generator is seeded so that every run shuffles and deals the same cards.
+    """
+    results = {}
+    for name, (make, number) in BENCHMARKS.items():
+        random.seed(seed)
+        func, setup = make()
+        timer = timeit.Timer(func, setup=setup or "pass")
+        with redirect_stdout(io.StringIO()):
+            best = min(timer.repeat(repeat=repeat, number=number))
+        results[name] = best / number * 1e9
+        print(f"{name:<36}{results[name]:>12,.0f} ns/op")
+    return results
+
+
+def save_results(results, path):
+    """Saves benchmark results to a JSON file, with details of the machine they were run on."""
+    with open(path, "w") as f:
+        json.dump({
+            "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "results": results,
+        }, f, indent=2)
+    print(f"\nResults saved to '{path}'")
+
+
+def compare_results(base_path, new_path, threshold=0.10):
+    """
+    Compares two saved benchmark results and flags every benchmark slower than the baseline by more than
+    the threshold (e.g. 0.10 for 10%). Returns the list of regressed benchmarks.
+    """
+    with open(base_path) as f:
+        base = json.load(f)["results"]
+    with open(new_path) as f:
+        new = json.load(f)["results"]
+
+    regressions = []
+    for name in [name for name in base if name in new]:
+        change = new[name] / base[name] - 1
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  <-- REGRESSION"
+        print(f"{name:<36}{base[name]:>12,.0f} ->{new[name]:>12,.0f} ns/op ({change * 100:+.1f}%){flag}")
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark card handling and full-round throughput.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    run = commands.add_parser("run", help="run all benchmarks and save the results")
+    run.add_argument("--output", type=str, default="benchmarks.json", help="path of the JSON results file")
+    run.add_argument("--repeat", type=int, default=5, help="no. of timing runs per benchmark (best is kept)")
+    compare = commands.add_parser("compare", help="compare two results files and flag regressions")
+    compare.add_argument("base", type=str, help="path of the baseline JSON results")
+    compare.add_argument("new", type=str, help="path of the new JSON results")
+    compare.add_argument("--threshold", type=float, default=0.10, help="slowdown flagged as a regression (0.10 = 10%%)")
+    args = parser.parse_args()
+
+    if args.command == "run":
+        save_results(run_benchmarks(args.repeat), args.output)
+    elif compare_results(args.base, args.new, args.threshold):
+        sys.exit(1)
@@ -1,25 +1,35 @@
 
 import random
-from playing_cards import suits, ranks, values  # import data from playing_cards.py
+from playing_cards import suits, ranks, card_values, card_is_ace, hand_transitions  # import data from playing_cards.py
 
 
 class Card:
     """Represents a single playing card with a rank, suit, and assigned value associated in Blackjack."""
+    __slots__ = ("code", "value", "is_ace")
 
-    def __init__(self, card_rank, card_suit):
+    def __init__(self, card_code):
         """
         args:
-            card_rank (str): rank of the card (e.g., '2', 'A', 'K').
-            card_suit (str): suit of the card (e.g., '♥' for Hearts).
+            card_code (int): integer encoding of the card from 0 to 51, i.e. suit index * 13 + rank index.
 
         attributes:
-            rank (str): rank of the card.
-            suit (str): suit of the card.
+            code (int): integer encoding of the card.
             value (int): numerical value assigned to the card.
+            is_ace (bool): flag variable to signify if the card is an ace - used in draw_card() of the Hand class.
         """
-        self.rank = card_rank
-        self.suit = card_suit
-        self.value = values[card_rank]
+        self.code = card_code
+        self.value = card_values[card_code]     # precomputed lookups (see playing_cards.py)
+        self.is_ace = card_is_ace[card_code]
+
+    @property
+    def rank(self):
+        """Returns the rank of the card as a string (e.g., '2', 'A', 'K')."""
+        return ranks[self.code % 13]
+
+    @property
+    def suit(self):
+        """Returns the suit of the card as a string (e.g., '♥' for Hearts)."""
+        return suits[self.code // 13]
 
     def display_card(self):
         """
@@ -29,27 +39,54 @@ class Card:
         return f"{self.rank}{self.suit}"
 
 
+FULL_DECK = tuple(Card(code) for code in range(52))    # cards are immutable, so all decks share these 52 objects
+
+
 class Deck:
     """Represents a full 52-deck of playing cards. """
 
-    def __init__(self):
-        """Initializes a Deck object as an empty list of cards."""
+    def __init__(self, rng=None):
+        """
+        Initializes a Deck object as an empty list of cards.
+
+        args:
+            rng (random.Random): independent random generator used for shuffling (e.g. a seeded generator
+                for reproducible simulations) - the global built-in random module by default.
+        """
         self.cards = []
+        self.rng = random if rng is None else rng
+        self.counter = None     # optional running count tracker (see counting.py)
 
     def reinstate_deck(self):
         """Resets a given deck object of all cards and reinstates the full deck in order."""
-        self.cards = []
-        for suit in suits:
-            for rank in ranks:
-                self.cards.append(Card(rank, suit))  # add to cards list
+        self.cards = list(FULL_DECK)
 
     def shuffle_deck(self):
-        """Shuffles the deck of cards in-place using shuffle() from the built-in random module."""
-        random.shuffle(self.cards)
+        """Shuffles the deck of cards in-place using shuffle() from the deck's random generator."""
+        self.rng.shuffle(self.cards)
+        if self.counter is not None:
+            self.counter.reset()
 
     def deal_card(self):
-        """Removes (in-place) and returns the top card from the deck, to be dealt to a given hand."""
-        return self.cards.pop()
+        """
+        Removes (in-place) and returns the top card from the deck, to be dealt to a given hand.
+        The running count is updated if a card counter is attached to the deck.
+        """
+        card = self.cards.pop()
+        if self.counter is not None:
+            self.counter.count(card)
+        return card
+
+    def needs_shuffle(self):
+        """Returns True if the deck must be reinstated and shuffled before a new round - always for a single deck."""
+        return True
+
+    def start_round(self):
+        """Marks the start of a new round - nothing to track for a single deck, reshuffled every round."""
+
+    def cards_left(self):
+        """Returns the number of cards left to be dealt from the deck."""
+        return len(self.cards)
 
     def display_deck(self):
         """
@@ -60,26 +97,116 @@ class Deck:
         print(", ".join([card.display_card() for card in self.cards]))
 
 
+class Shoe(Deck):
+    """
+    Represents a casino shoe of one or more 52-card decks. Cards are stored once in a preallocated list and
+    dealt by advancing an index, and the shoe is only reshuffled once the cut card has been reached.
+    """
+
+    def __init__(self, num_decks=6, penetration=0.75, rng=None):
+        """
+        args:
+            num_decks (int): number of 52-card decks in the shoe (1 to 8).
+            penetration (float): fraction of the shoe dealt before the cut card is reached (between 0 and 1).
+            rng (random.Random): independent random generator used for shuffling (see Deck class).
+
+        attributes:
+            cards (list): all cards of the shoe, in dealing order after a shuffle.
+            position (int): index of the next card to be dealt.
+            cut_card (int): position of the cut card, triggering a reshuffle before the next round.
+            round_start (int): position of the first card dealt in the current round (see start_round()).
+        """
+        if not 1 <= num_decks <= 8:
+            raise ValueError("Error: number of decks must be between 1 and 8.")
+        if not 0 < penetration < 1:
+            raise ValueError("Error: penetration must be between 0 and 1.")
+        super().__init__(rng)
+        self.num_decks = num_decks
+        self.cards = list(FULL_DECK) * num_decks
+        self.cut_card = int(len(self.cards) * penetration)
+        self.position = len(self.cards)     # shuffled before the first round
+        self.round_start = self.position
+
+    def reinstate_deck(self):
+        """Gathers all dealt cards back into the shoe by resetting the dealing position."""
+        self.position = 0
+        self.round_start = 0
+
+    def start_round(self):
+        """Marks the start of a new round: cards dealt from here on are in play until the next round."""
+        self.round_start = self.position
+
+    def reshuffle_discards(self):
+        """
+        Reshuffles the cards discarded in earlier rounds to continue dealing, leaving the cards in play of the current
+        round out of the shoe: they are moved before the dealing position, as if dealt from the reshuffled shoe.
+        """
+        in_play, discards = self.cards[self.round_start:self.position], self.cards[:self.round_start]
+        self.rng.shuffle(discards)
+        self.cards = in_play + discards
+        self.position = len(in_play)
+        self.round_start = 0
+        if self.counter is not None:    # the count restarts with the cards in play, already seen
+            self.counter.reset()
+            for card in in_play:
+                self.counter.count(card)
+
+    def deal_card(self):
+        """
+        Returns the card at the current position of the shoe and advances the position. If the shoe runs out
+        during a round (only possible with a very deep penetration), the discards of earlier rounds are reshuffled
+        to continue dealing, without the cards in play (see reshuffle_discards()).
+        """
+        if self.position == len(self.cards):
+            self.reshuffle_discards()
+        card = self.cards[self.position]
+        self.position += 1
+        if self.counter is not None:
+            self.counter.count(card)
+        return card
+
+    def needs_shuffle(self):
+        """Returns True if the cut card has been reached and the shoe must be reshuffled before a new round."""
+        return self.position >= self.cut_card
+
+    def cards_left(self):
+        """Returns the number of cards left to be dealt before the end of the shoe."""
+        return len(self.cards) - self.position
+
+    def display_deck(self):
+        """Displays all cards left to be dealt from the shoe in a line - used for debugging."""
+        print(f"\nCurrently {self.cards_left()} card(s) left in the {self.num_decks}-deck shoe.")
+        print(", ".join([card.display_card() for card in self.cards[self.position:]]))
+
+
 class Hand:
     """Represents a player's or dealer's hand of playing cards in Blackjack."""
+    __slots__ = ("cards", "state")
 
     def __init__(self):
         """
         attributes:
-            cards (list): list of dealt cards representing a given hand (player or dealer).
-            aces (int): number of aces present in a hand with value 11 - used in adjust_aces() method.
-            value (int): total sum of a given hand in Blackjack.
-            adjusted (bool): flag variable to signify if a hand has been adjusted for aces.
+            cards (list): list of dealt cards representing a given hand (player or dealer) - used for display.
+            state (int): hand state encoding the total and soft flag, advanced with a precomputed transition
+                table for each card drawn (see next_hand_state() in playing_cards.py).
         """
         self.cards = []
-        self.aces = 0
-        self.value = 0
+        self.state = 0
+
+    @property
+    def value(self):
+        """Total sum of a given hand in Blackjack."""
+        return self.state & 31
+
+    @property
+    def aces(self):
+        """Number of aces present in a hand with value 11 (0 or 1, as two 11-value aces would exceed 21)."""
+        return self.state >> 5
 
     def reset_hand(self):
         """Resets the hand, clearing cards and resetting attributes for the start of a new round"""
-        self.cards = []
-        self.aces = 0
-        self.value = 0
+        self.cards.clear()
+        self.state = 0
 
     def display_hand(self):
         """
@@ -87,28 +214,17 @@ class Hand:
         comma-separated list of cards in a single line - for debugging.
         """
         print(f"\nCurrently {len(self.cards)} cards in hand with {self.aces} 11-value aces.")
-        print(f"Total value: {self.value} (adjusted: {self.adjusted})")
+        print(f"Total value: {self.value}")
         print(", ".join([card.display_card() for card in self.cards]))
 
     def draw_card(self, card_deck):
         """
-        Adds a card to a given hand from a specified card deck and updates the hand's value.
+        Adds a card to a given hand from a specified card deck and updates the hand's state, with aces
+        already adjusted by the transition table.
 
         args:
             card_deck (Deck): deck object from which to draw a card.
         """
         card = card_deck.deal_card()     # take card from a given deck
         self.cards.append(card)     # add to hand's cards list (hand)
-        self.value += card.value    # update hand value
-        if card.rank == "A":
-            self.aces += 1
-
-    def adjust_aces(self):
-        """
-        Adjusts the value of a given hand by checking if the hand value has exceeded 21 and
-        whether one or more ace cards are present. If so, it deducts hand value by 10 for each ace
-        card adjust to prevent busting, i.e. equivalent to changing an ace card's value from 11 to 1.
-        """
-        while self.aces > 0 and self.value > 21:
-            self.value -= 10    # equivalent to ace card value changing to 1
-            self.aces -= 1      # keep track of aces with value 11
+        self.state = hand_transitions[self.state][card.value]   # update hand value
@@ -0,0 +1,164 @@
+import math
+import time
+import random
+import argparse
+from statistics import NormalDist
+from card_handling import Deck
+from gameplay import WIDTH, CHAR, LOSS, WIN, PUSH
+from simulation import Simulator, flat_bet, mimic_dealer
+from streaming_stats import RunningStats
+
+
+class BottomDealingDeck(Deck):
+    """
+    Single deck dealing the dealer's draws from the bottom of the deck and all other cards from the top. The
+    shuffled deck is exchangeable, so this does not change the odds of the game: it only lets the dealer draw
+    the same cards whatever the number of hits taken by the player, for paired comparisons of strategies.
+    """
+
+    def __init__(self, rng=None):
+        """
+        args:
+            rng (random.Random): independent random generator used for shuffling (see Deck class).
+
+        attributes:
+            dealer_turn (bool): flag variable to signify that cards are dealt to the dealer (from the bottom).
+        """
+        super().__init__(rng)
+        self.dealer_turn = False
+
+    def deal_card(self):
+        """Removes and returns the top card from the deck, or the bottom card during the dealer's turn."""
+        if not self.dealer_turn:
+            return super().deal_card()
+        card = self.cards.pop(0)
+        if self.counter is not None:
+            self.counter.count(card)
+        return card
+
+
+def deal_dealer_from_bottom(game):
+    """Wraps the dealer_draws() method of a game object to deal its draws from the bottom of a BottomDealingDeck."""
+    deck, dealer_draws = game.deck, game.dealer_draws
+
+    def wrapper():
+        deck.dealer_turn = True
+        try:
+            return dealer_draws()
+        finally:
+            deck.dealer_turn = False
+    game.dealer_draws = wrapper
+
+
+class PairedComparison:
+    """
+    Compares two strategies with common random numbers: both play every round with the same shuffled deck
+    (two decks shuffled by generators with the same seed) and the same dealer draws (see BottomDealingDeck).
+    The outcomes of both strategies are strongly correlated, so the standard error of their mean difference
+    per round is much smaller than with two independent runs of the same no. of rounds.
+    """
+
+    def __init__(self, play_a, play_b, bet_a=flat_bet, bet_b=flat_bet, seed=0, starting_chips=10 ** 12):
+        """
+        args:
+            play_a (callable): hit/stand strategy A (see Simulator class).
+            play_b (callable): hit/stand strategy B.
+            bet_a (callable): bet strategy A.
+            bet_b (callable): bet strategy B.
+            seed (int): common seed of the random generators shuffling both decks.
+            starting_chips (int): initial chips of both simulated players.
+
+        attributes:
+            sims (tuple): Simulator objects playing strategies A and B.
+            stats (tuple): RunningStats of the chips won per round by strategies A and B.
+            difference (RunningStats): chips won per round by A minus chips won by B, with outcomes WIN, LOSS
+                or PUSH if A did better, worse or the same as B, and the difference of both bankrolls.
+            elapsed (float): total time in seconds spent playing rounds in run().
+        """
+        self.sims = (
+            Simulator(starting_chips, bet_a, play_a, deck=BottomDealingDeck(random.Random(seed))),
+            Simulator(starting_chips, bet_b, play_b, deck=BottomDealingDeck(random.Random(seed))),
+        )
+        for sim in self.sims:
+            deal_dealer_from_bottom(sim.game)
+        self.stats = (RunningStats(), RunningStats())
+        self.difference = RunningStats()
+        self.elapsed = 0.0
+
+    def run(self, n_rounds):
+        """Plays n_rounds paired rounds, stopping early if either player runs out of chips."""
+        sim_a, sim_b = self.sims
+        chips_a, chips_b = sim_a.game.player_chips, sim_b.game.player_chips
+        start = time.perf_counter()
+        for _ in range(n_rounds):
+            if not (sim_a.game.has_chips() and sim_b.game.has_chips()):
+                break
+            before_a, before_b = chips_a.total, chips_b.total
+            sim_a.play_round()
+            sim_b.play_round()
+            won_a, won_b = chips_a.total - before_a, chips_b.total - before_b
+            self.stats[0].update(won_a, sim_a.game.outcome, chips_a.total)
+            self.stats[1].update(won_b, sim_b.game.outcome, chips_b.total)
+            outcome = WIN if won_a > won_b else LOSS if won_a < won_b else PUSH
+            self.difference.update(won_a - won_b, outcome, chips_a.total - chips_b.total)
+        self.elapsed += time.perf_counter() - start
+
+    def variance_reduction(self):
+        """
+        Returns the ratio of the variance of the difference between two independent runs (sum of both
+        variances) to the variance of the paired difference: the factor by which common random numbers
+        reduce the no. of rounds needed for the same standard error.
+        """
+        paired = self.difference.variance()
+        independent = self.stats[0].variance() + self.stats[1].variance()
+        return independent / paired if paired > 0 else math.inf
+
+    def display(self, level=0.95):
+        """Displays a table of the mean difference per round with its confidence interval and variance reduction."""
+        diff = self.difference
+        if diff.n == 0:
+            return
+        half_width = NormalDist().inv_cdf(0.5 + level / 2) * diff.standard_error()
+        independent_error = math.sqrt((self.stats[0].variance() + self.stats[1].variance()) / diff.n)
+        print("\n" + "".center(WIDTH, CHAR))
+        print(f"***  PAIRED COMPARISON (A - B)  ***".center(WIDTH, CHAR))
+        print("" + "".center(WIDTH, CHAR))
+        print(f"{CHAR * 2}| Rounds: {diff.n} |".ljust(WIDTH, CHAR))
+        print(f"{CHAR * 2}| Mean per round A: {self.stats[0].mean:+.4f} |".ljust(WIDTH, CHAR))
+        print(f"{CHAR * 2}| Mean per round B: {self.stats[1].mean:+.4f} |".ljust(WIDTH, CHAR))
+        print(f"{CHAR * 2}| Difference: {diff.mean:+.4f} +/- {half_width:.4f} |".ljust(WIDTH, CHAR))
+        print(f"{CHAR * 2}| Std. error (paired): {diff.standard_error():.5f} |".ljust(WIDTH, CHAR))
+        print(f"{CHAR * 2}| Std. error (independent): {independent_error:.5f} |".ljust(WIDTH, CHAR))
+        print(f"{CHAR * 2}| Variance reduction: {self.variance_reduction():.1f}x |".ljust(WIDTH, CHAR))
+        print("".center(WIDTH, CHAR))
+        for outcome, name in ((WIN, "A better"), (LOSS, "B better"), (PUSH, "Same result")):
+            count = diff.outcomes[outcome]
+            print(f"{CHAR * 2}| {name}: {count} ({count / diff.n * 100:.2f}%) |".ljust(WIDTH, CHAR))
+        print("" + "".center(WIDTH, CHAR))
+        print(f"\n{diff.n} paired rounds simulated in {self.elapsed:.2f}s")
+
+
+def parse_strategy(name):
+    """Returns the hit/stand strategy named on the command line: "basic", "dealer", or a total to hit below."""
+    if name == "basic":
+        from strategy import load_strategy
+        return load_strategy()
+    if name == "dealer":
+        return mimic_dealer
+    if not name.isdigit():
+        raise ValueError(f"Error: unknown strategy '{name}' (basic, dealer or a total to hit below).")
+    threshold = int(name)
+    return lambda player_hand, dealer_upcard: "h" if player_hand.value < threshold else "s"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare two hit/stand strategies with common random numbers.")
+    parser.add_argument("a", type=str, help="strategy A: basic, dealer (hit below 17) or a total to hit below")
+    parser.add_argument("b", type=str, help="strategy B: basic, dealer (hit below 17) or a total to hit below")
+    parser.add_argument("--rounds", type=int, default=100_000, help="number of paired rounds to simulate")
+    parser.add_argument("--seed", type=int, default=0, help="common seed of the shuffles of both strategies")
+    args = parser.parse_args()
+
+    comparison = PairedComparison(parse_strategy(args.a), parse_strategy(args.b), seed=args.seed)
+    comparison.run(args.rounds)
+    comparison.display()
@@ -0,0 +1,70 @@
+from playing_cards import ranks
+
+# card counting weights for each rank, in the same order as ranks (2, 3, ..., K, A) in playing_cards.py:
+HI_LO = (1, 1, 1, 1, 1, 0, 0, 0, -1, -1, -1, -1, -1)
+HI_OPT_I = (0, 1, 1, 1, 1, 0, 0, 0, -1, -1, -1, -1, 0)
+OMEGA_II = (1, 1, 2, 2, 2, 1, 0, -1, -2, -2, -2, -2, 0)
+
+
+class CardCounter:
+    """
+    Tracks the running count of the cards dealt from a Deck or Shoe in O(1) per card. Attached to a deck, the
+    count is updated by deal_card() and reset by shuffle_deck() (see card_handling.py), so bet strategies can
+    read the true count without rescanning the cards left.
+    """
+
+    def __init__(self, deck, weights=HI_LO):
+        """
+        args:
+            deck (Deck): deck or shoe the counter is attached to.
+            weights (tuple): counting weight of each rank (e.g. HI_LO, HI_OPT_I or OMEGA_II).
+
+        attributes:
+            card_weights (tuple): weights precomputed for each card code (0-51).
+            running_count (int): sum of the weights of all cards dealt since the last shuffle.
+        """
+        if len(weights) != len(ranks):
+            raise ValueError(f"Error: a weight table needs one weight for each of the {len(ranks)} ranks.")
+        self.deck = deck
+        self.card_weights = tuple(weights[code % len(ranks)] for code in range(52))
+        self.running_count = 0
+        deck.counter = self
+
+    def count(self, card):
+        """Adds the weight of a dealt card to the running count."""
+        self.running_count += self.card_weights[card.code]
+
+    def reset(self):
+        """Resets the running count after a shuffle."""
+        self.running_count = 0
+
+    def true_count(self):
+        """Returns the running count per deck left to be dealt (at least half a deck, to bound the estimate)."""
+        return self.running_count / max(self.deck.cards_left() / 52, 0.5)
+
+
+class CountBetPolicy:
+    """
+    Count-aware bet sizing for the non-interactive mode of Blackjack.handle_bet(): bets one unit at a true count
+    of 1 or less, and one unit per point of true count above that, up to a maximum spread of units.
+    """
+
+    def __init__(self, unit=1, spread=8):
+        """
+        args:
+            unit (int): chips bet per unit.
+            spread (int): maximum no. of units bet.
+        """
+        self.unit = unit
+        self.spread = spread
+
+    def __call__(self, game):
+        """
+        Returns the bet of the next round from the true count of the game's deck counter. Bets are sized before
+        handle_deck(), so a deck about to be reshuffled (always, for a single deck) counts as a fresh one: zero.
+        """
+        counter = getattr(game.deck, "counter", None)
+        if counter is None:
+            raise ValueError("Error: count-aware bets need a CardCounter attached to the game's deck.")
+        true_count = 0 if game.deck.needs_shuffle() else counter.true_count()
+        return self.unit * max(1, min(self.spread, int(true_count)))
@@ -1,6 +1,15 @@
 from card_handling import Deck, Hand
+from playing_cards import dealer_stands_s17, dealer_stands_h17
 
 WIDTH, CHAR = 50, "-"
+LOSS, WIN, PUSH, PLAYER_BUST, DEALER_BUST = range(5)    # round outcomes
+
+# questions asked to the player (see Blackjack.ask()), also sent to remote players by server.py:
+CHIPS_QUESTION = "\nEnter starting chips: "
+ROUND_QUESTION = "\nStart new round? (y/n) "
+BET_QUESTION = "\nEnter your bet: "
+ACTION_QUESTION = "\nHit or stand? (h/s): "
+INVALID_INPUT = "Error: invalid input."
 
 
 class Chips:
@@ -54,11 +63,19 @@ class Chips:
 class Blackjack:
     """Represents a simple version of a blackjack game to call and handle gameplay methods accordingly."""
 
-    def __init__(self):
+    def __init__(self, starting_chips=None, verbose=True, deck=None, output=print, prompt=input, hit_soft_17=False):
         """
         Initialize a Blackjack game object with a deck of cards, player's and dealer's hands, and chip management.
         Deck, Hand, and Card classes have been defined and programmed within the card_handling.py file.
 
+        args:
+            starting_chips (int): starting chips for a headless game - if None, the user is prompted to cash in.
+            verbose (bool): if False, round results are not printed (used for simulations, see simulation.py).
+            deck (Deck): deck or multi-deck Shoe to deal from - a single deck reshuffled every round by default.
+            output (callable): function displaying a line of text to the player - print() by default.
+            prompt (callable): function asking the player for a line of input - input() by default.
+            hit_soft_17 (bool): if True, the dealer hits a soft 17 (e.g. A+6) instead of standing on all 17s.
+
         Attributes:
             deck (Deck): deck of cards object used in the game.
             hands (dict): dictionary containing objects of the player's and dealer's hands.
@@ -69,33 +86,79 @@ class Blackjack:
             blackjacks (int): total number of times the player achieved a blackjack, not including dealer busts.
             pushes (int): total number of games that ended in a tie (push).
             busts (int): total number of rounds that ended with the player busting (hand value exceeding 21)
+            verbose (bool): flag to print the outcome of each round.
+            strategy (StrategyTable): optional table of optimal plays shown as hints (see strategy.py).
+            outcome (int): outcome of the last round played (LOSS, WIN, PUSH, PLAYER_BUST or DEALER_BUST).
+            recorder (RoundRecorder): optional recorder logging every finished round (see round_log.py).
+            dealer_stands (tuple): precomputed flags of the hand states the dealer stands on.
         """
-        self.deck = Deck()  # initialises and shuffles deck
+        self.deck = Deck() if deck is None else deck
         self.hands = {
             "dealer": Hand(),
             "player": Hand()
         }
-        self.starting_chips = self.cash_in()
+        self.output = output
+        self.prompt = prompt
+        self.starting_chips = self.cash_in() if starting_chips is None else starting_chips
         self.player_chips = Chips(self.starting_chips)
         self.rounds = 0
         self.player_wins = 0
         self.blackjacks = 0
         self.pushes = 0
         self.busts = 0
+        self.verbose = verbose
+        self.strategy = None
+        self.outcome = None
+        self.recorder = None
+        self.dealer_stands = dealer_stands_h17 if hit_soft_17 else dealer_stands_s17
+
+    def ask(self, question, parse):
+        """
+        Prompts the player until a valid answer is given, displaying the error message of each invalid answer.
+
+        args:
+            question (str): question asked to the player (e.g. BET_QUESTION).
+            parse (callable): called with the answer, returns (value, None) if valid or (None, error message).
+        """
+        while True:
+            value, error = parse(self.prompt(question))
+            if error is None:
+                return value
+            self.output(error)
 
     @staticmethod
-    def cash_in():
+    def parse_chips(answer):
+        """Returns (starting chips, None) for a valid cash-in answer, else (None, error message)."""
+        try:
+            amount = int(answer)
+        except ValueError:
+            return None, INVALID_INPUT
+        return (amount, None) if amount > 0 else (None, "Error: negative value.")
+
+    def parse_bet(self, answer):
+        """Returns (bet, None) for a valid bet answer (see bet_error()), else (None, error message)."""
+        try:
+            player_bet = int(answer)
+        except ValueError:
+            return None, INVALID_INPUT
+        error = self.bet_error(player_bet)
+        return (None, error) if error else (player_bet, None)
+
+    @staticmethod
+    def parse_yes_no(answer):
+        """Returns (True/False, None) for a "y"/"n" answer, else (None, error message)."""
+        answer = answer.strip().lower()
+        return (answer == "y", None) if answer in ("y", "n") else (None, INVALID_INPUT)
+
+    @staticmethod
+    def parse_action(answer):
+        """Returns ("h"/"s", None) for a hit or stand answer, else (None, error message)."""
+        answer = answer.strip().lower()
+        return (answer, None) if answer in ("h", "s") else (None, INVALID_INPUT)
+
+    def cash_in(self):
         """Prompts the user to enter the starting chips value for all playable rounds."""
-        while True:
-            try:
-                amount = int(input("\nEnter starting chips: "))
-                if amount > 0:
-                    return amount
-                else:
-                    print("Error: negative value.")
-            except ValueError:
-                print("Error: invalid input.")
-        return amount
+        return self.ask(CHIPS_QUESTION, self.parse_chips)
 
     def has_chips(self):
         """Returns a quick boolean result checking if the user has sufficient remaining chips."""
@@ -109,64 +172,79 @@ class Blackjack:
         "n" (no) -> returns False: allows the player to cash out.
         """
         if self.has_chips():
-            print(f"\n(Total chips: {self.player_chips.total})")
-            while True:
-                ans = input("\nStart new round? (y/n) ").lower()
-                if ans == "y":
-                    return True
-                elif ans == "n":
-                    return False
-                print("Error: invalid input.")
+            self.show_total()
+            return self.ask(ROUND_QUESTION, self.parse_yes_no)
         return False
 
-    def handle_bet(self):
-        """Manage the player's round bet by checking if the bet is valid and updating chip information accordingly."""
-        while True:
-            try:
-                print(f"\n(Total chips: {self.player_chips.total})")
-                player_bet = int(input("\nEnter your bet: "))
-                if player_bet < 0:
-                    print("Error: negative bet value.")
-                elif player_bet > self.player_chips.total:
-                    print("Error: bet exceeds available chips.")
-                elif player_bet == 0:
-                    print("Error: null bet value")
-                else:
-                    self.player_chips.current_bet = player_bet      # current round player bet
-                    self.player_chips.total_bets += player_bet
-                    break
-            except ValueError:
-                print("Error: invalid input.")
+    def show_total(self):
+        """Displays the player's total chips."""
+        self.output(f"\n(Total chips: {self.player_chips.total})")
+
+    def handle_bet(self, policy=None):
+        """
+        Manage the player's round bet by checking if the bet is valid and updating chip information accordingly.
+        In non-interactive mode, a bet policy (e.g. count-aware bet sizing, see counting.py) is called as
+        policy(game) to size the bet instead, which is clamped between 1 and the player's total chips.
+        """
+        if policy is not None:
+            self.place_bet(min(max(int(policy(self)), 1), self.player_chips.total))
+            return
+        self.show_total()
+        self.place_bet(self.ask(BET_QUESTION, self.parse_bet))
+
+    def bet_error(self, player_bet):
+        """Returns an error message if a bet is invalid (non-positive or exceeding the player's chips), else None."""
+        if player_bet < 0:
+            return "Error: negative bet value."
+        elif player_bet > self.player_chips.total:
+            return "Error: bet exceeds available chips."
+        elif player_bet == 0:
+            return "Error: null bet value"
+        return None
+
+    def place_bet(self, player_bet):
+        """
+        Sets a validated bet as the current round bet and adds it to the total of all bets made.
+
+        args:
+            player_bet (int): bet value, between 1 and the player's total chips.
+        """
+        self.player_chips.current_bet = player_bet      # current round player bet
+        self.player_chips.total_bets += player_bet
 
     def handle_deck(self):
-        """Resets player and dealer hand attributes, and creates a new shuffled deck of cards for a new round."""
+        """
+        Resets player and dealer hand attributes, and creates a new shuffled deck of cards for a new round.
+        A multi-deck Shoe is only reshuffled once its cut card has been reached.
+        """
         if self.hands["player"].cards:
             for hand in self.hands.values():
                 hand.reset_hand()
-        self.deck.reinstate_deck()      # re-gather all cards
-        self.deck.shuffle_deck()        # shuffle deck
+        if self.deck.needs_shuffle():
+            self.deck.reinstate_deck()      # re-gather all cards
+            self.deck.shuffle_deck()        # shuffle deck
+        self.deck.start_round()             # cards dealt from here on are in play
 
     def first_deal(self):
         """
-        Deals the first two initial cards of blackjack to the player and dealer. Uses the adjust_aces() method
-        call to adjust the values of aces in the players hands. For two cards, this would only occur in the instance
-        that a player is dealt two ace cards whereby the value would be adjusted from 22 to 12.
+        Deals the first two initial cards of blackjack to the player and dealer. Values of aces are adjusted by
+        the hand state transitions: for two cards, this would only occur in the instance that a hand is dealt
+        two ace cards whereby the value would be adjusted from 22 to 12.
         """
         for _ in range(2):
             for hand in self.hands.values():
                 hand.draw_card(self.deck)
-        self.hands["player"].adjust_aces()
 
     def show_player_hand(self):
         """Displays all cards in the player's hand and its total value"""
         player_hand = self.hands["player"].cards
-        print(f"YOU: {', '.join([f'({card.display_card()})' for card in player_hand])}".center(WIDTH))
-        print(f"(value: {self.hands['player'].value})".center(WIDTH))
+        self.output(f"YOU: {', '.join([f'({card.display_card()})' for card in player_hand])}".center(WIDTH))
+        self.output(f"(value: {self.hands['player'].value})".center(WIDTH))
 
     def show_dealer_upcard(self):
         """Displays only the second card of the dealer during the first two-card deal in blackjack."""
         dealer_hand = self.hands["dealer"].cards
-        print(f"DEALER: (??), ({dealer_hand[-1].display_card()})".center(WIDTH))
+        self.output(f"DEALER: (??), ({dealer_hand[-1].display_card()})".center(WIDTH))
 
     def show_dealer_full(self):
         """
@@ -174,45 +252,46 @@ class Blackjack:
         the dealer's hand after the player decides to stand or busts after hitting.
         """
         dealer_hand = self.hands["dealer"].cards
-        print(f"DEALER: {', '.join([f'({card.display_card()})' for card in dealer_hand])}".center(WIDTH))
-        print(f"(value: {self.hands['dealer'].value})".center(WIDTH))
+        self.output(f"DEALER: {', '.join([f'({card.display_card()})' for card in dealer_hand])}".center(WIDTH))
+        self.output(f"(value: {self.hands['dealer'].value})".center(WIDTH))
 
     def display_table(self, reveal_dealer=False):
         """
         Display the full blackjack game table which are the player's and dealer's hands.
         reveal_dealer (bool) arg used to reveal the dealer's hand after player's turn.
         """
-        print("\n" + "".center(WIDTH, CHAR))
+        self.output("\n" + "".center(WIDTH, CHAR))
         if reveal_dealer:
             self.show_dealer_full()
-            print("".center(WIDTH, CHAR))
+            self.output("".center(WIDTH, CHAR))
         else:
             self.show_dealer_upcard()
-            print("".center(WIDTH, CHAR))
+            self.output("".center(WIDTH, CHAR))
         self.show_player_hand()
-        print("".center(WIDTH, CHAR))
+        self.output("".center(WIDTH, CHAR))
 
-    @staticmethod
-    def hit_or_stand():
+    def hit_or_stand(self):
         """
-        Asks the player (user) to hit or stand.
+        Asks the player (user) to hit or stand, showing the optimal play as a hint if a strategy table is set.
         "h" (hit) -> returns str: will continue the game sub-loop to give the player to hit
         again given they haven't busted.
         "s" (stand) -> returns str: will exit the game sub-loop to finish the player's turn.
         """
-        while True:
-            action = input("\nHit or stand? (h/s): ").lower()
-            if action in ["h", "s"]:
-                return action
-            print("Error: invalid input.")
+        self.show_hint()
+        return self.ask(ACTION_QUESTION, self.parse_action)
+
+    def show_hint(self):
+        """Displays the optimal play of the player's hand against the dealer's upcard, if a strategy table is set."""
+        if self.strategy is not None:
+            player_hand, upcard = self.hands["player"], self.hands["dealer"].cards[-1]
+            hint = self.strategy.best_action(player_hand.value, player_hand.aces > 0, upcard.value)
+            self.output(f"\n(Hint: the optimal play is to {'HIT' if hint == 'h' else 'STAND'})")
 
     def hit(self):
         """
         Handles the player action of hitting by removing the top card from the deck and adding it to the player's hand.
         """
-        player_hand = self.hands["player"]
-        player_hand.draw_card(self.deck)
-        player_hand.adjust_aces()
+        self.hands["player"].draw_card(self.deck)
 
     def player_bust(self):
         """
@@ -220,23 +299,28 @@ class Blackjack:
         If so, returns True to exit an inner-game loop and terminate the current round.
         """
         if self.hands["player"].value > 21:
-            self.rounds += 1
+            self.busts += 1
             self.player_chips.bet_lost()
+            self.end_round(PLAYER_BUST)
             return True
         return False
 
     def dealer_draws(self):
         """
-        Dealer draws cards, if applicable, until the dealer's hand total is 17 or greater.
-        The top card from the deck is dealt to the dealer and the hand is adjusted for aces each draw
+        Dealer draws cards, if applicable, until the dealer's hand total is 17 or greater (18 or greater for a
+        soft hand if the dealer hits soft 17). The top card from the deck is dealt to the dealer each draw.
         """
         dealer_hand, flag = self.hands["dealer"], False
-        while dealer_hand.value < 17:       # dealer must draw cards hand value is 17 or higher:
+        while not self.dealer_stands[dealer_hand.state]:    # precomputed stand flag of the hand state
             dealer_hand.draw_card(self.deck)
-            dealer_hand.adjust_aces()
             flag = True
         return flag
 
+    def announce(self, message):
+        """Displays a message on the outcome of a round, unless the game is headless (verbose=False)."""
+        if self.verbose:
+            self.output(message)
+
     def dealer_bust(self):
         """
         Checks if the dealer busts (hand total exceeding 21) after drawing cards
@@ -245,13 +329,13 @@ class Blackjack:
         if self.hands["dealer"].value > 21:
             if self.hands["player"].value == 21:
                 self.blackjacks += 1
-                print("\nDealer busts! You win this round with a blackjack!")
+                self.announce("\nDealer busts! You win this round with a blackjack!")
             else:
-                print("\nDealer busts! You win this round.")
-            print(f"(Chips won: {self.player_chips.current_bet})")
-            self.rounds += 1
+                self.announce("\nDealer busts! You win this round.")
+            self.announce(f"(Chips won: {self.player_chips.current_bet})")
             self.player_wins += 1
             self.player_chips.bet_won()
+            self.end_round(DEALER_BUST)
             return True
         return False
 
@@ -269,51 +353,64 @@ class Blackjack:
         if player_score == dealer_score:    # PUSH
             self.pushes += 1
             if player_score == 21:  # if both scores 21
-                print("PUSH! You and the dealer both got 21!")
+                self.announce("PUSH! You and the dealer both got 21!")
             else:
-                print("\nPUSH! Both hand totals equal.")
-            print(f"(Chips returned: {self.player_chips.current_bet})")
+                self.announce("\nPUSH! Both hand totals equal.")
+            self.announce(f"(Chips returned: {self.player_chips.current_bet})")
+            outcome = PUSH
         elif player_score > dealer_score:   # WIN
             self.player_chips.bet_won()
             self.player_wins += 1
             if player_score == 21:
                 self.blackjacks += 1
-                print("\nBLACKJACK! You got 21!")
+                self.announce("\nBLACKJACK! You got 21!")
             else:
-                print("\nWIN! You beat the dealer's hand.")
-            print(f"(Chips won: {self.player_chips.current_bet})")
+                self.announce("\nWIN! You beat the dealer's hand.")
+            self.announce(f"(Chips won: {self.player_chips.current_bet})")
+            outcome = WIN
         elif player_score < dealer_score:   # LOSS
             self.player_chips.bet_lost()
             if dealer_score == 21:
-                print("LOSS! The Dealer got 21!")
+                self.announce("LOSS! The Dealer got 21!")
             else:
-                print("\nLOSS! Dealer's hand is higher")
-            print(f"(Chips lost: {self.player_chips.current_bet})")
+                self.announce("\nLOSS! Dealer's hand is higher")
+            self.announce(f"(Chips lost: {self.player_chips.current_bet})")
+            outcome = LOSS
+        self.end_round(outcome)
+
+    def end_round(self, outcome):
+        """
+        Updates the no. of rounds played and stores the outcome of the finished round.
+        The round is also logged if a round recorder has been set (see round_log.py).
+        """
         self.rounds += 1
+        self.outcome = outcome
+        if self.recorder is not None:
+            self.recorder.record(self)
 
     def display_statistics(self):
         """Displays a table of game statistics throughout all played rounds, given at least one round was played."""
         if self.rounds > 0:
-            print("\n" + "".center(WIDTH, CHAR))
-            print(f"***  GAME STATISTICS  ***".center(WIDTH, CHAR))
-            print("" + "".center(WIDTH, CHAR))
+            self.output("\n" + "".center(WIDTH, CHAR))
+            self.output(f"***  GAME STATISTICS  ***".center(WIDTH, CHAR))
+            self.output("" + "".center(WIDTH, CHAR))
             # games played, no. of wins etc. :
-            print(f"{CHAR * 2}| Rounds played: {self.rounds} |".ljust(WIDTH, CHAR))
+            self.output(f"{CHAR * 2}| Rounds played: {self.rounds} |".ljust(WIDTH, CHAR))
             win_perc = (self.player_wins / self.rounds) * 100    # win percentage
-            print(f"{CHAR * 2}| Wins: {self.player_wins} ({win_perc :.1f}%) |".ljust(WIDTH, CHAR))
-            print(f"{CHAR * 2}| Blackjacks: {self.blackjacks} |".ljust(WIDTH, CHAR))
-            print(f"{CHAR * 2}| Pushes: {self.pushes} |".ljust(WIDTH, CHAR))
-            print(f"{CHAR * 2}| Busts: {self.busts} |".ljust(WIDTH, CHAR))
+            self.output(f"{CHAR * 2}| Wins: {self.player_wins} ({win_perc :.1f}%) |".ljust(WIDTH, CHAR))
+            self.output(f"{CHAR * 2}| Blackjacks: {self.blackjacks} |".ljust(WIDTH, CHAR))
+            self.output(f"{CHAR * 2}| Pushes: {self.pushes} |".ljust(WIDTH, CHAR))
+            self.output(f"{CHAR * 2}| Busts: {self.busts} |".ljust(WIDTH, CHAR))
             # bet winnings, returns etc. :
-            print("".center(WIDTH, CHAR))
+            self.output("".center(WIDTH, CHAR))
             chips = self.player_chips
-            print(f"{CHAR * 2}| Starting chips: {self.starting_chips} |".ljust(WIDTH, CHAR))
-            print(f"{CHAR * 2}| Leaving chips: {chips.total} |".ljust(WIDTH, CHAR))
+            self.output(f"{CHAR * 2}| Starting chips: {self.starting_chips} |".ljust(WIDTH, CHAR))
+            self.output(f"{CHAR * 2}| Leaving chips: {chips.total} |".ljust(WIDTH, CHAR))
             diff = chips.total - self.starting_chips
-            print(f"{CHAR * 2}| Returns: {diff} ({(diff / self.starting_chips) * 100 :.1f}%) |".ljust(WIDTH, CHAR))
-            print("".center(WIDTH, CHAR))
-            print(f"{CHAR * 2}| Chips bet: {chips.total_bets} |".ljust(WIDTH, CHAR))
-            print(f"{CHAR * 2}| Total winnings: {chips.winnings} |".ljust(WIDTH, CHAR))
-            print(f"{CHAR * 2}| Biggest win: {chips.biggest_bet_won} |".ljust(WIDTH, CHAR))
-            print(f"{CHAR * 2}| Biggest loss: {chips.biggest_bet_loss} |".ljust(WIDTH, CHAR))
-            print("" + "".center(WIDTH, CHAR))
+            self.output(f"{CHAR * 2}| Returns: {diff} ({(diff / self.starting_chips) * 100 :.1f}%) |".ljust(WIDTH, CHAR))
+            self.output("".center(WIDTH, CHAR))
+            self.output(f"{CHAR * 2}| Chips bet: {chips.total_bets} |".ljust(WIDTH, CHAR))
+            self.output(f"{CHAR * 2}| Total winnings: {chips.winnings} |".ljust(WIDTH, CHAR))
+            self.output(f"{CHAR * 2}| Biggest win: {chips.biggest_bet_won} |".ljust(WIDTH, CHAR))
+            self.output(f"{CHAR * 2}| Biggest loss: {chips.biggest_bet_loss} |".ljust(WIDTH, CHAR))
+            self.output("" + "".center(WIDTH, CHAR))
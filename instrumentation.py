@@ -0,0 +1,120 @@
+import json
+from time import perf_counter
+from gameplay import WIDTH, CHAR
+
+PHASES = ("handle_deck", "first_deal", "hit", "dealer_draws", "dealer_bust", "determine_winner")   # timed methods
+
+
+class Profiler:
+    """
+    Opt-in instrumentation of a Blackjack game: times and counts each game phase, and counts the cards dealt,
+    dealer draws and ace adjustments. The game's methods are only wrapped on its own instance by attach(), so a
+    game without a profiler runs the original code with no overhead at all.
+    """
+
+    def __init__(self, trace=False, max_events=100_000):
+        """
+        args:
+            trace (bool): flag to also record a timeline of every phase call (see export_trace()).
+            max_events (int): maximum no. of timeline events recorded, to bound memory use.
+
+        attributes:
+            calls (dict): no. of calls of each phase.
+            times (dict): total time in seconds spent in each phase.
+            cards_dealt (int): total no. of cards dealt from the deck.
+            dealer_cards (int): total no. of cards drawn by the dealer in dealer_draws() iterations.
+            ace_adjustments (int): total no. of aces changed from 11 to 1 by hand state transitions.
+            events (list): Chrome trace events of each phase call, if trace is True.
+        """
+        self.trace = trace
+        self.max_events = max_events
+        self.calls = dict.fromkeys(PHASES, 0)
+        self.times = dict.fromkeys(PHASES, 0.0)
+        self.cards_dealt = 0
+        self.dealer_cards = 0
+        self.ace_adjustments = 0
+        self.events = []
+        self.game = None
+        self.origin = perf_counter()
+
+    def attach(self, game):
+        """Instruments a Blackjack game object by wrapping its phase methods and its deck's deal_card() method."""
+        self.game = game
+        for phase in PHASES:
+            setattr(game, phase, self.timed(phase, getattr(game, phase)))
+        game.dealer_draws = self.counted_dealer_draws(game.dealer_draws)
+        game.end_round = self.counted_end_round(game.end_round)
+        game.deck.deal_card = self.counted_deal_card(game.deck.deal_card)
+        return self
+
+    def detach(self):
+        """Removes the instrumentation, restoring the game's original methods."""
+        for name in PHASES + ("end_round",):
+            vars(self.game).pop(name, None)
+        vars(self.game.deck).pop("deal_card", None)
+        self.game = None
+
+    def timed(self, phase, method):
+        """Returns a wrapper of a phase method, timing and counting each call."""
+        def wrapper(*args, **kwargs):
+            start = perf_counter()
+            result = method(*args, **kwargs)
+            end = perf_counter()
+            self.calls[phase] += 1
+            self.times[phase] += end - start
+            if self.trace and len(self.events) < self.max_events:
+                self.events.append({
+                    "name": phase, "ph": "X", "pid": 0, "tid": 0,
+                    "ts": (start - self.origin) * 1e6, "dur": (end - start) * 1e6,     # in microseconds
+                })
+            return result
+        return wrapper
+
+    def counted_dealer_draws(self, method):
+        """Returns a wrapper of dealer_draws() counting the cards drawn by the dealer."""
+        def wrapper():
+            dealer_hand = self.game.hands["dealer"]
+            before = len(dealer_hand.cards)
+            result = method()
+            self.dealer_cards += len(dealer_hand.cards) - before
+            return result
+        return wrapper
+
+    def counted_end_round(self, method):
+        """
+        Returns a wrapper of end_round() counting the ace adjustments made in both hands during the round:
+        each adjustment deducted 10 from the sum of the card values of a hand.
+        """
+        def wrapper(outcome):
+            for hand in self.game.hands.values():
+                self.ace_adjustments += (sum(card.value for card in hand.cards) - hand.value) // 10
+            return method(outcome)
+        return wrapper
+
+    def counted_deal_card(self, method):
+        """Returns a wrapper of deal_card() counting the cards dealt."""
+        def wrapper():
+            self.cards_dealt += 1
+            return method()
+        return wrapper
+
+    def display_summary(self):
+        """Displays a table of the calls, total and mean time of each phase, followed by the card counters."""
+        total = sum(self.times.values()) or 1.0
+        print("\n" + "".center(WIDTH, CHAR))
+        print(f"***  PHASE PROFILE  ***".center(WIDTH, CHAR))
+        print("" + "".center(WIDTH, CHAR))
+        for phase in PHASES:
+            calls, seconds = self.calls[phase], self.times[phase]
+            mean = seconds / calls * 1e6 if calls else 0.0
+            print(f"{CHAR * 2}| {phase}: {calls} calls, {mean:.2f}us ({seconds / total * 100:.1f}%) |".ljust(WIDTH, CHAR))
+        print("".center(WIDTH, CHAR))
+        print(f"{CHAR * 2}| Cards dealt: {self.cards_dealt} |".ljust(WIDTH, CHAR))
+        print(f"{CHAR * 2}| Dealer draws: {self.dealer_cards} |".ljust(WIDTH, CHAR))
+        print(f"{CHAR * 2}| Ace adjustments: {self.ace_adjustments} |".ljust(WIDTH, CHAR))
+        print("" + "".center(WIDTH, CHAR))
+
+    def export_trace(self, path):
+        """Saves the recorded timeline as a Chrome trace JSON file (open with chrome://tracing or Perfetto)."""
+        with open(path, "w") as f:
+            json.dump({"traceEvents": self.events, "displayTimeUnit": "ms"}, f)
@@ -0,0 +1,87 @@
+import time
+import asyncio
+import argparse
+from server import PROMPT
+
+
+async def play_client(host, port, n_rounds, latencies):
+    """
+    Connects a simulated player to the server and plays n_rounds rounds, betting 1 chip and hitting below 17.
+    The latency of every action (time from sending an answer to receiving the next prompt) is appended to latencies.
+    Returns the number of rounds played.
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    rounds, value = 0, 0
+
+    async def next_prompt():
+        nonlocal value
+        while True:
+            line = (await reader.readline()).decode()
+            if not line:
+                raise ConnectionError("server disconnected")
+            if line.startswith(PROMPT):
+                return line[len(PROMPT):].strip()
+            if line.strip().startswith("YOU:"):
+                value = None    # the player's hand value follows on the next line
+            elif value is None:
+                value = int(line.strip().strip("()").split(": ")[1])
+
+    async def answer(text):
+        start = time.perf_counter()
+        writer.write(f"{text}\n".encode())
+        await writer.drain()
+        question = await next_prompt()
+        latencies.append(time.perf_counter() - start)
+        return question
+
+    question = await next_prompt()
+    question = await answer(1_000_000)     # starting chips
+    while True:
+        if question.startswith("Start new round"):
+            if rounds == n_rounds:
+                break
+            rounds += 1
+            question = await answer("y")
+        elif question.startswith("Enter your bet"):
+            question = await answer(1)
+        elif question.startswith("Hit or stand"):
+            question = await answer("h" if value < 17 else "s")
+        else:
+            raise ValueError(f"Error: unexpected prompt '{question}'.")
+
+    writer.write(b"n\n")
+    await writer.drain()
+    while True:     # read the final statistics until the server says goodbye (or disconnects)
+        line = await reader.readline()
+        if not line or line.strip() == b"BYE":
+            break
+    writer.close()
+    await writer.wait_closed()
+    return rounds
+
+
+async def run_load(host, port, n_clients, n_rounds):
+    """Runs n_clients concurrent simulated players, and returns the total rounds, elapsed time and latencies."""
+    latencies = []
+    start = time.perf_counter()
+    rounds = await asyncio.gather(*(play_client(host, port, n_rounds, latencies) for _ in range(n_clients)))
+    return sum(rounds), time.perf_counter() - start, latencies
+
+
+def percentile(values, q):
+    """Returns the q-th percentile (0 to 100) of a list of values, using the nearest-rank method."""
+    values = sorted(values)
+    return values[max(0, min(len(values) - 1, round(q / 100 * len(values)) - 1))]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate load on a Blackjack server (see server.py).")
+    parser.add_argument("--host", type=str, default="127.0.0.1", help="address of the server")
+    parser.add_argument("--port", type=int, default=8021, help="port of the server")
+    parser.add_argument("--clients", type=int, default=100, help="number of concurrent simulated players")
+    parser.add_argument("--rounds", type=int, default=100, help="number of rounds played by each player")
+    args = parser.parse_args()
+
+    rounds, elapsed, latencies = asyncio.run(run_load(args.host, args.port, args.clients, args.rounds))
+    print(f"{args.clients} clients played {rounds} rounds in {elapsed:.2f}s ({rounds / elapsed:,.0f} rounds/s)")
+    print(f"Action latency: p50 {percentile(latencies, 50) * 1000:.2f}ms, p99 {percentile(latencies, 99) * 1000:.2f}ms")
@@ -1,14 +1,20 @@
 from gameplay import Blackjack
-import os
+from strategy import game_strategy
+from rendering import TerminalRenderer
+import sys
+
+renderer = TerminalRenderer()   # frames are drawn in a single flush when the user is prompted
 
 
 def clear_screen():
-    os.system('cls' if os.name == 'nt' else 'clear')
+    renderer.clear()
 
 
 def main():
     clear_screen()
-    game = Blackjack()  # 1. user cashes in with starting chips
+    game = Blackjack(output=renderer.write, prompt=renderer.input)  # 1. user cashes in with starting chips
+    if "--hints" in sys.argv[1:]:
+        game.strategy = game_strategy(game)     # show the optimal play before each hit or stand decision
     clear_screen()
 
     while game.start_round():  # 2. user starts/continues round (given sufficient chips) or cashes-out
@@ -20,7 +26,7 @@ def main():
         game.first_deal()  # 5. two cards dealt to player and dealer
 
         clear_screen()
-        print("\nShuffling and dealing cards...")
+        renderer.write("\nShuffling and dealing cards...")
         game.display_table()  # 6. display player hand with dealer's upcard
 
         # ====== PLAYER'S TURN ====== #
@@ -41,12 +47,12 @@ def main():
         # ====== DEALER'S TURN ====== #
         if not busted:  # 9. after player stands, dealer manages their cards
             clear_screen()
-            print("\nRevealing dealer's hand... ")
+            renderer.write("\nRevealing dealer's hand... ")
             game.display_table(reveal_dealer=True)  # 10. reveal dealer's hidden card
 
             if game.dealer_draws():  # 11. if permitted, dealer must draw cards until their hand is at least 17
                 clear_screen()
-                print("\nDealer's hand total below 17.\nDealer drawing cards...")
+                renderer.write("\nDealer's hand total below 17.\nDealer drawing cards...")
                 game.display_table(reveal_dealer=True)  # display all cards across the table
 
             if game.dealer_bust():  # 12. whilst drawing cards, if dealer busts then player wins
@@ -59,15 +65,16 @@ def main():
         else:  # if player has busted (result from hitting loop)
             clear_screen()
             game.display_table(reveal_dealer=True)
-            print("\nBUST! Your hand exceeded 21.")
-            print(f"(Chips lost: {game.player_chips.current_bet})")
+            renderer.write("\nBUST! Your hand exceeded 21.")
+            renderer.write(f"(Chips lost: {game.player_chips.current_bet})")
 
     if not game.has_chips():  # 14. game is over if user runs out of chips
-        print("\nGame over. You ran out of chips.")
+        renderer.write("\nGame over. You ran out of chips.")
 
     # ====== GAME OVER ====== #
     game.display_statistics()  # 15. game statistics are displayed if user quits or loses after at least one game
-    print("\nThanks for playing!")
+    renderer.write("\nThanks for playing!")
+    renderer.flush()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,125 @@
+import os
+import time
+import random
+import argparse
+from multiprocessing import Pool
+from card_handling import Deck, Shoe
+from gameplay import WIDTH, CHAR
+from simulation import Simulator, flat_bet, mimic_dealer
+from streaming_stats import RunningStats
+
+MAX_COUNTERS = ("biggest_bet_won", "biggest_bet_loss")     # merged by taking the maximum, all others are summed
+
+
+def task_rng(master_seed, index):
+    """
+    Returns an independent random generator for a given task, derived from the master seed. String seeds are
+    hashed with SHA-512 by the random module, so streams are reproducible across runs and processes.
+    """
+    return random.Random(f"{master_seed}:{index}")
+
+
+def run_task(task):
+    """Plays the rounds of a single task in a worker process and returns the Simulator results."""
+    index, master_seed, n_rounds, starting_chips, bet_strategy, play_strategy, num_decks, penetration = task
+    rng = task_rng(master_seed, index)
+    deck = Shoe(num_decks, penetration, rng) if num_decks else Deck(rng)
+    sim = Simulator(starting_chips, bet_strategy, play_strategy, deck)
+    sim.run(n_rounds)
+    return sim.results()
+
+
+def merge_results(results):
+    """
+    Merges a list of Simulator results into one, summing all counters except the biggest win and loss,
+    and merging the streaming statistics accumulators.
+    """
+    merged = {}
+    for result in results:
+        for key, value in result.items():
+            if key not in merged:
+                merged[key] = value
+            elif isinstance(value, RunningStats):
+                merged[key] = merged[key].merge(value)
+            elif key in MAX_COUNTERS:
+                merged[key] = max(merged[key], value)
+            else:
+                merged[key] += value
+    return merged
+
+
+def run_parallel(n_rounds, master_seed=0, n_workers=None, n_tasks=64, starting_chips=1_000_000,
+                 bet_strategy=flat_bet, play_strategy=mimic_dealer, num_decks=None, penetration=0.75):
+    """
+    Splits n_rounds into n_tasks tasks with their own bankroll and random generator, plays them across a pool of
+    worker processes and merges the results in task order. Results only depend on the master seed and the
+    number of tasks (not on the number of workers), so reruns are bit-identical on any machine.
+
+    args:
+        n_rounds (int): total number of rounds to simulate.
+        master_seed (int): seed from which every task's random generator is derived.
+        n_workers (int): number of worker processes - all available cores by default.
+        n_tasks (int): number of independent tasks the rounds are split into.
+        starting_chips (int): starting chips of each task's simulated player.
+        bet_strategy (callable): bet strategy (see simulation.py) - must be picklable, e.g. a module-level function.
+        play_strategy (callable): hit/stand strategy (see simulation.py) - must be picklable.
+        num_decks (int): number of decks in a shoe, or None for a single deck reshuffled every round.
+        penetration (float): fraction of the shoe dealt before reshuffling.
+    """
+    n_workers = n_workers or os.cpu_count()
+    base, extra = divmod(n_rounds, n_tasks)
+    tasks = [
+        (i, master_seed, base + (i < extra), starting_chips, bet_strategy, play_strategy, num_decks, penetration)
+        for i in range(n_tasks)
+    ]
+    start = time.perf_counter()
+    with Pool(n_workers) as pool:
+        results = pool.map(run_task, tasks, chunksize=1)
+    merged = merge_results(results)
+    merged["wall_time"] = time.perf_counter() - start
+    return merged
+
+
+def display_results(results):
+    """Displays a table of merged simulation statistics, in the same layout as display_statistics()."""
+    rounds = results["rounds"]
+    diff = results["total"] - results["starting_chips"]
+    rows = [
+        f"Rounds played: {rounds}",
+        f"Wins: {results['player_wins']} ({results['player_wins'] / rounds * 100 :.1f}%)",
+        f"Blackjacks: {results['blackjacks']}",
+        f"Pushes: {results['pushes']}",
+        f"Busts: {results['busts']}",
+        None,
+        f"Starting chips: {results['starting_chips']}",
+        f"Leaving chips: {results['total']}",
+        f"Returns: {diff} ({diff / results['total_bets'] * 100 :.2f}% of chips bet)",
+        None,
+        f"Chips bet: {results['total_bets']}",
+        f"Total winnings: {results['winnings']}",
+        f"Biggest win: {results['biggest_bet_won']}",
+        f"Biggest loss: {results['biggest_bet_loss']}",
+    ]
+    print("\n" + "".center(WIDTH, CHAR))
+    print(f"***  SIMULATION STATISTICS  ***".center(WIDTH, CHAR))
+    print("" + "".center(WIDTH, CHAR))
+    for row in rows:
+        print("".center(WIDTH, CHAR) if row is None else f"{CHAR * 2}| {row} |".ljust(WIDTH, CHAR))
+    print("" + "".center(WIDTH, CHAR))
+    results["stats"].display()
+    print(f"\n{rounds} rounds simulated in {results['wall_time']:.2f}s ({rounds / results['wall_time']:,.0f} rounds/s)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run a Blackjack simulation across multiple processes.")
+    parser.add_argument("--rounds", type=int, default=1_000_000, help="total number of rounds to simulate")
+    parser.add_argument("--seed", type=int, default=0, help="master seed of all task random generators")
+    parser.add_argument("--workers", type=int, default=None, help="number of worker processes (all cores if unset)")
+    parser.add_argument("--tasks", type=int, default=64, help="number of independent tasks")
+    parser.add_argument("--decks", type=int, default=None, help="number of decks in a shoe (single deck per round if unset)")
+    parser.add_argument("--penetration", type=float, default=0.75, help="fraction of the shoe dealt before reshuffling")
+    args = parser.parse_args()
+
+    display_results(run_parallel(
+        args.rounds, args.seed, args.workers, args.tasks, num_decks=args.decks, penetration=args.penetration
+    ))
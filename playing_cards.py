@@ -35,4 +35,32 @@ values = {
     "Q": 10,
     "K": 10,
     "A": 11     # aces can change to value 1 if hand value exceeds 21
-}               # refer to "adjust_aces()" method in card_handling.py
+}               # refer to next_hand_state() below
+
+# lookups precomputed for each card code (0-51), where code = suit index * 13 + rank index:
+card_values = tuple(values[rank] for suit in suits for rank in ranks)
+card_is_ace = tuple(rank == "A" for suit in suits for rank in ranks)
+
+
+# a hand's value is encoded as a small integer state = soft flag * 32 + total (0-31), where a soft hand counts
+# one ace as 11 - e.g. A+6 is the state 32 + 17 (soft 17) and 10+7 is the state 17 (hard 17):
+def next_hand_state(state, value):
+    """
+    Returns the state of a hand after drawing a card of a given value, adjusting 11-value aces to 1 if the
+    total exceeds 21. Busted hands (totals over 21) are final states.
+    """
+    total, aces = state & 31, state >> 5
+    if total > 21:
+        return state
+    total, aces = total + value, aces + (value == 11)
+    while aces > 0 and total > 21:
+        total -= 10     # equivalent to ace card value changing to 1
+        aces -= 1
+    return aces << 5 | total
+
+
+# hand state lookups precomputed for each of the 64 states, indexed by [state] or [state][card value]:
+hand_transitions = tuple(tuple(next_hand_state(state, value) for value in range(12)) for state in range(64))
+hand_busts = tuple(state & 31 > 21 for state in range(64))
+dealer_stands_s17 = tuple(state & 31 >= 17 for state in range(64))     # dealer stands on all 17s
+dealer_stands_h17 = tuple(state & 31 >= 18 or state == 17 for state in range(64))   # dealer hits soft 17
@@ -0,0 +1,95 @@
+from functools import lru_cache
+from playing_cards import card_values, dealer_stands_s17, dealer_stands_h17
+
+OUTCOMES = ("17", "18", "19", "20", "21", "bust")    # possible final dealer hands
+CARD_VALUES = range(2, 12)     # a composition counts the cards of each value from 2 to 11 (ace)
+
+
+def full_composition(num_decks=1):
+    """Returns the composition of a full shoe: a tuple counting the cards of each value from 2 to 11 (ace)."""
+    composition = [0] * len(CARD_VALUES)
+    for value in card_values:
+        composition[value - 2] += num_decks
+    return tuple(composition)
+
+
+def deck_composition(deck):
+    """Returns the composition of the cards left to be dealt from a Deck or Shoe object (see card_handling.py)."""
+    composition = [0] * len(CARD_VALUES)
+    for card in deck.cards[len(deck.cards) - deck.cards_left():]:
+        composition[card.value - 2] += 1
+    return tuple(composition)
+
+
+def remove_card(composition, value):
+    """Returns a new composition with one card of the given value removed (e.g. a card seen on the table)."""
+    composition = list(composition)
+    composition[value - 2] -= 1
+    return tuple(composition)
+
+
+@lru_cache(maxsize=2 ** 18)
+def _dealer_outcomes(total, aces, composition, hit_soft_17=False):
+    """
+    Recursively computes the probabilities of each final dealer hand (see OUTCOMES), from a hand total, its
+    number of 11-value aces and the composition of the cards left. The dealer draws cards until a hand state
+    the dealer stands on (17 or greater, or hard 17 or greater if hitting soft 17), adjusting aces to prevent
+    busting, as in dealer_draws() of the Blackjack class.
+    """
+    if total > 21:
+        return 0.0, 0.0, 0.0, 0.0, 0.0, 1.0
+    if (dealer_stands_h17 if hit_soft_17 else dealer_stands_s17)[aces << 5 | total]:   # see Hand state encoding
+        return tuple(1.0 if outcome == str(total) else 0.0 for outcome in OUTCOMES)
+
+    n = sum(composition)
+    if n == 0:
+        raise ValueError("Error: no cards left for the dealer to draw.")
+    probabilities = [0.0] * len(OUTCOMES)
+    for i, count in enumerate(composition):
+        if count == 0:
+            continue
+        value = i + 2
+        new_total, new_aces = total + value, aces + (value == 11)
+        while new_aces > 0 and new_total > 21:     # see next_hand_state() in playing_cards.py
+            new_total -= 10
+            new_aces -= 1
+        remaining = composition[:i] + (count - 1,) + composition[i + 1:]
+        p = count / n
+        for j, q in enumerate(_dealer_outcomes(new_total, new_aces, remaining, hit_soft_17)):
+            probabilities[j] += p * q
+    return tuple(probabilities)
+
+
+@lru_cache(maxsize=4096)
+def _dealer_probabilities(upcard, composition, hit_soft_17):
+    """Cached dealer_probabilities() on a hashable (upcard, composition tuple, rule) key."""
+    return _dealer_outcomes(upcard, int(upcard == 11), composition, hit_soft_17)
+
+
+def dealer_probabilities(upcard, composition, hit_soft_17=False):
+    """
+    Returns the exact probabilities of each final dealer hand (17, 18, 19, 20, 21 or bust - see OUTCOMES) given
+    the dealer's upcard and the composition of the cards left, from which the hidden card is also drawn.
+    Results are cached with a bounded LRU cache on the (upcard, composition) key.
+
+    args:
+        upcard (int): value of the dealer's upcard (2 to 11 for an ace).
+        composition (tuple): number of cards left of each value from 2 to 11 (see full_composition()) - any
+            sequence, converted to a tuple before the cache lookup.
+        hit_soft_17 (bool): if True, the dealer hits a soft 17 instead of standing on all 17s.
+    """
+    return _dealer_probabilities(upcard, tuple(composition), bool(hit_soft_17))
+
+
+def dealer_bust_probability(upcard, composition, hit_soft_17=False):
+    """Returns the exact probability of the dealer busting given the upcard value and composition of cards left."""
+    return dealer_probabilities(upcard, composition, hit_soft_17)[-1]
+
+
+if __name__ == "__main__":
+    # exact dealer outcomes for each upcard dealt from a single full deck:
+    print("upcard  " + "".join(outcome.rjust(8) for outcome in OUTCOMES))
+    for upcard in CARD_VALUES:
+        probabilities = dealer_probabilities(upcard, remove_card(full_composition(), upcard))
+        label = "A" if upcard == 11 else str(upcard)
+        print(label.ljust(8) + "".join(f"{p * 100:7.2f}%" for p in probabilities))
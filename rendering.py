@@ -0,0 +1,106 @@
+import os
+import sys
+import shutil
+
+CLEAR_SCREEN = "\x1b[H\x1b[2J"     # move the cursor home and clear the whole screen
+CLEAR_LINE = "\x1b[K"              # clear from the cursor to the end of the line
+CLEAR_BELOW = "\x1b[J"             # clear from the cursor to the end of the screen
+
+
+def move_to(row):
+    """Returns the ANSI escape code moving the cursor to the start of a given row (starting at 1)."""
+    return f"\x1b[{row};1H"
+
+
+class TerminalRenderer:
+    """
+    Buffered terminal renderer replacing a clear_screen() shell call and print() calls for every frame. Output
+    lines are collected into an in-memory frame, which is written in a single flush using ANSI escape codes,
+    only redrawing the lines that changed since the last flush. On terminals without ANSI support (or when the
+    output is not a terminal), and for frames taller than the terminal, new lines are simply printed in turn.
+    """
+
+    def __init__(self, stream=None):
+        """
+        args:
+            stream (file): text stream to render to - sys.stdout by default.
+
+        attributes:
+            ansi (bool): flag variable to signify if the stream supports ANSI escape codes.
+            frame (list): lines of the frame being built.
+            screen (list): lines currently displayed on screen (None before the first flush).
+            written (int): no. of lines of the frame already printed (when lines are printed in turn).
+            scrolling (bool): flag variable to signify if the current frame is taller than the terminal.
+        """
+        self.stream = sys.stdout if stream is None else stream
+        self.ansi = self.supports_ansi(self.stream)
+        self.frame = []
+        self.screen = None
+        self.written = 0
+        self.scrolling = False
+
+    @staticmethod
+    def supports_ansi(stream):
+        """Returns True if a stream is a terminal supporting ANSI escape codes (i.e. not a dumb terminal)."""
+        if not hasattr(stream, "isatty") or not stream.isatty():
+            return False
+        if os.name == "nt":     # only modern Windows terminals enable ANSI escape codes by default
+            return "WT_SESSION" in os.environ or "TERM" in os.environ
+        return os.environ.get("TERM", "") not in ("", "dumb")
+
+    def clear(self):
+        """Starts a new frame - the previous frame stays on screen until the next flush."""
+        self.frame = []
+        self.written = 0
+        if self.scrolling:  # screen rows no longer match frame lines, so the next frame clears the screen
+            self.scrolling = False
+            self.screen = None
+
+    def write(self, message=""):
+        """Output adapter for the Blackjack class: adds a message (one or more lines) to the current frame."""
+        self.frame.extend(str(message).split("\n"))
+
+    def flush(self):
+        """Writes the current frame to the stream in a single write, redrawing only the lines that changed."""
+        if self.ansi and not self.scrolling and len(self.frame) >= shutil.get_terminal_size().lines:
+            self.scrolling = True   # cursor positions are only valid within the terminal's rows
+            if self.screen is not None and self.frame[:len(self.screen)] == self.screen:
+                self.written = len(self.screen)     # only print the lines added since the last flush
+            else:
+                self.stream.write(CLEAR_SCREEN)
+                self.written = 0
+        if not self.ansi or self.scrolling:
+            lines = self.frame[self.written:]
+            if lines:
+                self.stream.write("\n".join(lines) + "\n")
+            self.written = len(self.frame)
+        else:
+            buffer = []
+            if self.screen is None:
+                buffer.append(CLEAR_SCREEN)
+                self.screen = []
+            for i, line in enumerate(self.frame):
+                if i >= len(self.screen) or self.screen[i] != line:
+                    buffer.append(f"{move_to(i + 1)}{line}{CLEAR_LINE}")
+            buffer.append(move_to(len(self.frame) + 1) + CLEAR_BELOW)    # clear any leftover lines
+            self.stream.write("".join(buffer))
+            self.screen = list(self.frame)
+        self.stream.flush()
+
+    def input(self, question=""):
+        """
+        Prompt adapter for the Blackjack class: flushes the frame and asks for input on the line below it. The
+        answered prompt is kept as a line of the frame, matching what the terminal echoed on screen.
+        """
+        *lines, question = str(question).split("\n")
+        self.frame.extend(lines)
+        self.flush()
+        self.stream.write(question)
+        self.stream.flush()
+        answer = input()
+        self.frame.append(question + answer)
+        if self.ansi and not self.scrolling:
+            self.screen = list(self.frame)
+        else:
+            self.written = len(self.frame)
+        return answer
@@ -0,0 +1,132 @@
+import time
+import argparse
+import numpy as np
+from gameplay import WIDTH, CHAR
+from vectorized import play_rounds
+
+
+class FlatBets:
+    """Bet policy over arrays of bankrolls: bets the same unit of chips every round."""
+
+    def __init__(self, unit=1):
+        """
+        args:
+            unit (int): chips bet every round.
+        """
+        self.unit = unit
+
+    def __call__(self, bankrolls):
+        """Returns the array of bets of the next round for an array of bankrolls."""
+        return np.full(bankrolls.size, self.unit, dtype=np.int64)
+
+
+class ProportionalBets:
+    """Bet policy over arrays of bankrolls: bets a fixed fraction of each bankroll (at least one chip)."""
+
+    def __init__(self, fraction=0.01):
+        """
+        args:
+            fraction (float): fraction of the current bankroll bet every round (between 0 and 1).
+        """
+        if not 0 < fraction <= 1:
+            raise ValueError("Error: bet fraction must be between 0 and 1.")
+        self.fraction = fraction
+
+    def __call__(self, bankrolls):
+        """Returns the array of bets of the next round for an array of bankrolls."""
+        return (bankrolls * self.fraction).astype(np.int64)
+
+
+def simulate_sessions(n_sessions, bankroll, max_rounds, bet_policy=None, strategy=None, goal=None, seed=None):
+    """
+    Plays n_sessions independent sessions in lockstep, one round at a time with play_rounds() for all sessions
+    still in play. As in main(), a session ends once the player runs out of chips (ruin, see has_chips()) or
+    cashes out, here after max_rounds rounds or on reaching a goal bankroll. Bets are clamped between 1 and
+    each bankroll, and the chips of won and lost bets are added and deducted as in Chips.bet_won()/bet_lost().
+
+    args:
+        n_sessions (int): number of sessions to simulate.
+        bankroll (int): starting chips of every session.
+        max_rounds (int): maximum no. of rounds per session.
+        bet_policy (callable): called with the array of bankrolls of the sessions in play, returns their bets
+            (see FlatBets and ProportionalBets) - one chip per round by default.
+        strategy (np.ndarray): (2, 32, 12) hit/stand table (see vectorized.py) - hit below 17 by default.
+        goal (int): bankroll at which a session cashes out - no goal by default.
+        seed (int): seed of the random generator.
+
+    returns:
+        dict: final bankrolls, ruin rounds (0 if never ruined), rounds played and elapsed time of all sessions.
+    """
+    bet_policy = FlatBets() if bet_policy is None else bet_policy
+    rng = np.random.default_rng(seed)
+    bankrolls = np.full(n_sessions, bankroll, dtype=np.int64)
+    ruin_rounds = np.zeros(n_sessions, dtype=np.int64)
+    rounds = np.zeros(n_sessions, dtype=np.int64)
+    playing = np.arange(n_sessions)
+    start = time.perf_counter()
+
+    for n_round in range(1, max_rounds + 1):
+        if playing.size == 0:
+            break
+        current = bankrolls[playing]
+        bets = np.clip(bet_policy(current), 1, current)
+        _, deltas = play_rounds(playing.size, bets, strategy, rng)
+        bankrolls[playing] = current + deltas
+        rounds[playing] += 1
+        ruined = bankrolls[playing] <= 0
+        ruin_rounds[playing[ruined]] = n_round
+        in_play = ~ruined if goal is None else ~ruined & (bankrolls[playing] < goal)
+        playing = playing[in_play]     # ruined (and cashed out) sessions are masked out of later rounds
+
+    return {
+        "bankrolls": bankrolls,
+        "ruin_rounds": ruin_rounds,
+        "rounds": rounds,
+        "starting_chips": bankroll,
+        "elapsed": time.perf_counter() - start,
+    }
+
+
+def display_results(results):
+    """Displays a table of the risk of ruin, time to ruin and percentiles of the final bankrolls."""
+    bankrolls, ruin_rounds = results["bankrolls"], results["ruin_rounds"]
+    ruined = ruin_rounds[ruin_rounds > 0]
+    risk = ruined.size / bankrolls.size
+    standard_error = np.sqrt(risk * (1 - risk) / bankrolls.size)
+    print("\n" + "".center(WIDTH, CHAR))
+    print(f"***  RISK OF RUIN  ***".center(WIDTH, CHAR))
+    print("" + "".center(WIDTH, CHAR))
+    print(f"{CHAR * 2}| Sessions: {bankrolls.size} |".ljust(WIDTH, CHAR))
+    print(f"{CHAR * 2}| Starting chips: {results['starting_chips']} |".ljust(WIDTH, CHAR))
+    print(f"{CHAR * 2}| Risk of ruin: {risk * 100:.2f}% (+/- {1.96 * standard_error * 100:.2f}%) |".ljust(WIDTH, CHAR))
+    if ruined.size:
+        print(f"{CHAR * 2}| Mean rounds to ruin: {ruined.mean():.1f} |".ljust(WIDTH, CHAR))
+        print(f"{CHAR * 2}| Median rounds to ruin: {np.median(ruined):.0f} |".ljust(WIDTH, CHAR))
+    print("".center(WIDTH, CHAR))
+    print(f"{CHAR * 2}| Mean final chips: {bankrolls.mean():.1f} |".ljust(WIDTH, CHAR))
+    for q in (5, 25, 50, 75, 95):
+        print(f"{CHAR * 2}| Final chips {q}th percentile: {np.percentile(bankrolls, q):.0f} |".ljust(WIDTH, CHAR))
+    print("" + "".center(WIDTH, CHAR))
+    rounds = results["rounds"].sum()
+    print(f"\n{rounds} rounds simulated in {results['elapsed']:.2f}s ({rounds / results['elapsed']:,.0f} rounds/s)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simulate many Blackjack sessions to estimate the risk of ruin.")
+    parser.add_argument("--sessions", type=int, default=10_000, help="number of sessions to simulate")
+    parser.add_argument("--chips", type=int, default=100, help="starting chips of every session")
+    parser.add_argument("--rounds", type=int, default=1_000, help="maximum number of rounds per session")
+    parser.add_argument("--bet", type=int, default=1, help="flat bet of every round")
+    parser.add_argument("--fraction", type=float, default=None, help="bet a fraction of the bankroll instead")
+    parser.add_argument("--goal", type=int, default=None, help="cash out once the bankroll reaches this value")
+    parser.add_argument("--basic", action="store_true", help="play the optimal strategy instead of hitting below 17")
+    parser.add_argument("--seed", type=int, default=None, help="seed of the random generator")
+    args = parser.parse_args()
+
+    policy = ProportionalBets(args.fraction) if args.fraction else FlatBets(args.bet)
+    if args.basic:
+        from strategy import load_strategy
+        table = load_strategy().hit_table()
+    else:
+        table = None
+    display_results(simulate_sessions(args.sessions, args.chips, args.rounds, policy, table, args.goal, args.seed))
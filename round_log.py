@@ -0,0 +1,141 @@
+import os
+import struct
+from array import array
+
+MAGIC = b"BJRL\x01"     # file signature and format version
+# fixed-size part of each record: round no., bet, outcome, player total, dealer total, no. of hits,
+# no. of player cards, no. of dealer cards and chip balance after the round (card codes follow):
+RECORD = struct.Struct("<IIBBBBBBq")
+FIELDS = ("round", "bet", "outcome", "player_total", "dealer_total", "hits", "player_count", "dealer_count", "balance")
+TYPECODES = ("I", "I", "B", "B", "B", "B", "B", "B", "q")     # array typecodes of each field
+
+
+class RoundRecorder:
+    """
+    Streams every finished round of a Blackjack game to a compact binary append-only file. Records are written
+    through a fixed-size buffer, so memory use stays bounded however many rounds are recorded.
+    Opt-in by setting the recorder attribute of a Blackjack object (see end_round() in gameplay.py).
+    """
+
+    def __init__(self, path, buffer_size=1 << 16):
+        """
+        args:
+            path (str): path of the log file, appended to if it already exists.
+            buffer_size (int): size in bytes of the write buffer.
+        """
+        new_file = not os.path.exists(path) or os.path.getsize(path) == 0
+        self.file = open(path, "ab", buffering=buffer_size)
+        if new_file:
+            self.file.write(MAGIC)
+
+    def record(self, game):
+        """
+        Appends a record of the round just finished by a game: bet, actions (no. of hits, followed by a stand
+        unless the player busted), cards dealt, final hand totals, outcome and chip balance.
+        """
+        player, dealer = game.hands["player"], game.hands["dealer"]
+        self.file.write(RECORD.pack(
+            game.rounds, game.player_chips.current_bet, game.outcome, player.value, dealer.value,
+            len(player.cards) - 2, len(player.cards), len(dealer.cards), game.player_chips.total
+        ))
+        self.file.write(bytes([card.code for card in player.cards] + [card.code for card in dealer.cards]))
+
+    def close(self):
+        """Flushes the buffer and closes the log file."""
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class RoundLogReader:
+    """Reads a binary round log written by RoundRecorder, record by record or as columnar arrays."""
+
+    def __init__(self, path):
+        """
+        args:
+            path (str): path of the log file.
+        """
+        self.path = path
+
+    def __iter__(self):
+        """Streams each record as a dictionary of fields, with the card codes (0-51) of both hands as bytes."""
+        with open(self.path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"Error: '{self.path}' is not a round log file.")
+            while True:
+                header = f.read(RECORD.size)
+                if len(header) < RECORD.size:   # end of file (or a partially written last record)
+                    return
+                record = dict(zip(FIELDS, RECORD.unpack(header)))
+                cards = f.read(record["player_count"] + record["dealer_count"])
+                record["player_cards"] = cards[:record["player_count"]]
+                record["dealer_cards"] = cards[record["player_count"]:]
+                yield record
+
+    def iter_batches(self, batch_size=1_000_000):
+        """
+        Yields the log as batches of columns: an array per field, and the cards of each hand as a flat
+        array of card codes with an array of offsets (cards of round i are codes[offsets[i]:offsets[i + 1]]).
+        """
+        columns = None
+        for record in self:
+            if columns is None:
+                columns = self._empty_columns()
+            for field in FIELDS:
+                columns[field].append(record[field])
+            for hand in ("player", "dealer"):
+                columns[f"{hand}_cards"].frombytes(record[f"{hand}_cards"])
+                columns[f"{hand}_offsets"].append(len(columns[f"{hand}_cards"]))
+            if len(columns["round"]) == batch_size:
+                yield columns
+                columns = None
+        if columns is not None:
+            yield columns
+
+    @staticmethod
+    def _empty_columns():
+        """Returns empty columns for a batch of records (see iter_batches())."""
+        columns = {field: array(typecode) for field, typecode in zip(FIELDS, TYPECODES)}
+        for hand in ("player", "dealer"):
+            columns[f"{hand}_cards"] = array("B")
+            columns[f"{hand}_offsets"] = array("q", [0])
+        return columns
+
+    def to_columns(self):
+        """Returns the whole log as a dictionary of columnar arrays (see iter_batches())."""
+        for columns in self.iter_batches(batch_size=None):
+            return columns
+        return self._empty_columns()
+
+    def to_parquet(self, path, batch_size=1_000_000):
+        """
+        Exports the log to a Parquet file (requires pyarrow), one row group per batch so memory use stays bounded.
+        The cards of each hand are stored as list columns of card codes.
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        types = {"I": pa.uint32(), "B": pa.uint8(), "q": pa.int64()}
+
+        def to_arrow(column):   # zero-copy view of an array column
+            return pa.Array.from_buffers(types[column.typecode], len(column), [None, pa.py_buffer(column)])
+
+        writer = None
+        try:
+            for columns in self.iter_batches(batch_size):
+                data = {field: to_arrow(columns[field]) for field in FIELDS}
+                for hand in ("player", "dealer"):
+                    data[f"{hand}_cards"] = pa.ListArray.from_arrays(
+                        to_arrow(columns[f"{hand}_offsets"]), to_arrow(columns[f"{hand}_cards"])
+                    )
+                table = pa.table(data)
+                if writer is None:
+                    writer = pq.ParquetWriter(path, table.schema)
+                writer.write_table(table)
+        finally:
+            if writer is not None:
+                writer.close()
@@ -0,0 +1,153 @@
+import asyncio
+import argparse
+from gameplay import Blackjack, CHIPS_QUESTION, ROUND_QUESTION, BET_QUESTION, ACTION_QUESTION
+
+PROMPT = "? "   # prefix of lines asking the client for a single line of input
+
+
+class Connection:
+    """
+    Input/output adapters of a single client connection, replacing print() and input() for a Blackjack game.
+    Displayed text is buffered and only flushed to the client when the player is asked for input.
+    """
+
+    def __init__(self, reader, writer):
+        """
+        args:
+            reader (asyncio.StreamReader): stream of lines sent by the client.
+            writer (asyncio.StreamWriter): stream of lines sent to the client.
+        """
+        self.reader = reader
+        self.writer = writer
+
+    def output(self, message=""):
+        """Output adapter for the Blackjack class: queues a message (one or more lines) for the client."""
+        self.writer.write(f"{message}\n".encode())
+
+    async def prompt(self, question):
+        """Async prompt adapter: sends the buffered output followed by a prompt line, and returns the client's answer."""
+        self.writer.write(f"{PROMPT}{question.strip()}\n".encode())
+        await self.writer.drain()
+        line = await self.reader.readline()
+        if not line:
+            raise ConnectionError("client disconnected")
+        return line.decode().strip()
+
+    async def ask(self, question, parse):
+        """Async version of Blackjack.ask(): asks the client until parse(answer) accepts a valid answer."""
+        while True:
+            value, error = parse(await self.prompt(question))
+            if error is None:
+                return value
+            self.output(error)
+
+
+class BlackjackServer:
+    """
+    Hosts many concurrent Blackjack tables, one per connected player, over a simple line protocol: every line sent
+    by the server is displayed text, except lines starting with "? " which ask the client for a single line of
+    input (chips, bet, "y"/"n" or "h"/"s"). The server sends "BYE" once the player has cashed out. Questions, answer
+    checks and displayed text are the same as in the terminal game (see Blackjack.ask() and its parse methods).
+    """
+
+    def __init__(self, strategy=None):
+        """
+        args:
+            strategy (StrategyTable): optional table of optimal plays shown as hints on every table (see strategy.py).
+
+        attributes:
+            tables (dict): Blackjack game objects of all connected players, keyed by table number.
+            next_table (int): number given to the next table opened.
+            rounds (int): total number of rounds played on all tables (reported when the server stops).
+        """
+        self.strategy = strategy
+        self.tables = {}
+        self.next_table = 1
+        self.rounds = 0
+
+    async def handle_client(self, reader, writer):
+        """Opens a table for a new connection and plays rounds until the player cashes out or disconnects."""
+        conn = Connection(reader, writer)
+        table = self.next_table
+        self.next_table += 1
+        try:
+            conn.output(f"Welcome to table {table}!")
+            game = Blackjack(await conn.ask(CHIPS_QUESTION, Blackjack.parse_chips), output=conn.output)
+            game.strategy = self.strategy
+            self.tables[table] = game
+            while game.has_chips():     # same flow as start_round()
+                game.show_total()
+                if not await conn.ask(ROUND_QUESTION, game.parse_yes_no):
+                    break
+                await self.play_round(game, conn)
+                self.rounds += 1
+            if not game.has_chips():
+                conn.output("\nGame over. You ran out of chips.")
+            game.display_statistics()
+            conn.output("\nThanks for playing!")
+            conn.output("BYE")
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.tables.pop(table, None)
+            writer.close()
+
+    @staticmethod
+    async def play_round(game, conn):
+        """Plays a single round on a table, following the same flow as main() with the client's inputs."""
+        game.show_total()   # same flow as handle_bet()
+        game.place_bet(await conn.ask(BET_QUESTION, game.parse_bet))
+        game.handle_deck()
+        game.first_deal()
+        game.display_table()
+
+        # ====== PLAYER'S TURN ====== #
+        while True:
+            game.show_hint()    # same flow as hit_or_stand()
+            if await conn.ask(ACTION_QUESTION, game.parse_action) == "s":
+                break
+            game.hit()
+            game.display_table()
+            if game.player_bust():
+                game.display_table(reveal_dealer=True)
+                conn.output("\nBUST! Your hand exceeded 21.")
+                conn.output(f"(Chips lost: {game.player_chips.current_bet})")
+                return
+
+        # ====== DEALER'S TURN ====== #
+        game.display_table(reveal_dealer=True)
+        if game.dealer_draws():
+            conn.output("\nDealer's hand total below 17.\nDealer drawing cards...")
+            game.display_table(reveal_dealer=True)
+        if not game.dealer_bust():
+            game.determine_winner()
+
+
+async def serve(host, port, strategy=None):
+    """Starts the server and serves clients until interrupted, then reports the number of tables and rounds played."""
+    server = BlackjackServer(strategy)
+    tcp_server = await asyncio.start_server(server.handle_client, host, port)
+    print(f"Serving Blackjack tables on {host}:{port}...")
+    try:
+        async with tcp_server:
+            await tcp_server.serve_forever()
+    finally:
+        print(f"\n{server.rounds} rounds played on {server.next_table - 1} tables")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Host Blackjack tables over TCP (line protocol).")
+    parser.add_argument("--host", type=str, default="127.0.0.1", help="address to listen on")
+    parser.add_argument("--port", type=int, default=8021, help="port to listen on")
+    parser.add_argument("--hints", action="store_true", help="show the optimal play before each hit or stand decision")
+    args = parser.parse_args()
+    if args.hints:
+        from strategy import load_strategy
+        strategy = load_strategy()
+    else:
+        strategy = None
+    try:
+        asyncio.run(serve(args.host, args.port, strategy))
+    except KeyboardInterrupt:
+        pass
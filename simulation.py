@@ -0,0 +1,150 @@
+import time
+import argparse
+from gameplay import Blackjack
+from card_handling import Shoe
+from round_log import RoundRecorder
+from streaming_stats import RunningStats
+from instrumentation import Profiler
+from counting import CardCounter, CountBetPolicy
+
+
+def flat_bet(game):
+    """Bet strategy: bets a single chip every round."""
+    return 1
+
+
+def mimic_dealer(player_hand, dealer_upcard):
+    """Hit/stand strategy: follows the dealer's rule by hitting on any hand total below 17."""
+    return "h" if player_hand.value < 17 else "s"
+
+
+class Simulator:
+    """Plays headless rounds of Blackjack with pluggable strategies, without any input() or print() calls."""
+
+    def __init__(self, starting_chips, bet_strategy=flat_bet, play_strategy=mimic_dealer, deck=None, recorder=None,
+                 hit_soft_17=False):
+        """
+        args:
+            starting_chips (int): initial amount of chips the simulated player cashes in.
+            bet_strategy (callable): called as bet_strategy(game) and returns the bet for the next round.
+            play_strategy (callable): called as play_strategy(player_hand, dealer_upcard) and returns "h" or "s".
+            deck (Deck): deck or multi-deck Shoe to deal from - a single deck reshuffled every round by default.
+            recorder (RoundRecorder): optional recorder streaming every round to a log file (see round_log.py).
+            hit_soft_17 (bool): if True, the dealer hits a soft 17 instead of standing on all 17s.
+
+        attributes:
+            game (Blackjack): headless game object holding the same counters shown by display_statistics().
+            elapsed (float): total time in seconds spent playing rounds in run().
+            stats (RunningStats): streaming accumulator of the return per chip bet (see streaming_stats.py).
+        """
+        self.game = Blackjack(starting_chips, verbose=False, deck=deck, hit_soft_17=hit_soft_17)
+        self.game.recorder = recorder
+        self.bet_strategy = bet_strategy
+        self.play_strategy = play_strategy
+        self.elapsed = 0.0
+        self.stats = RunningStats()
+
+    def play_round(self):
+        """
+        Plays a single round following the same flow as main(): bet, deal, player's turn, dealer's turn and
+        resolution. Bets are clamped between 1 and the player's remaining chips.
+        """
+        game = self.game
+        game.handle_bet(self.bet_strategy)
+        game.handle_deck()
+        game.first_deal()
+
+        # ====== PLAYER'S TURN ====== #
+        player_hand, dealer_upcard = game.hands["player"], game.hands["dealer"].cards[-1]
+        while self.play_strategy(player_hand, dealer_upcard) == "h":
+            game.hit()
+            if game.player_bust():
+                return
+
+        # ====== DEALER'S TURN ====== #
+        game.dealer_draws()
+        if not game.dealer_bust():
+            game.determine_winner()
+
+    def run(self, n_rounds, target_half_width=None, check_every=10_000):
+        """
+        Plays up to n_rounds successive rounds, stopping early if the player runs out of chips.
+        Returns the number of rounds played per second.
+
+        args:
+            n_rounds (int): maximum number of rounds to play.
+            target_half_width (float): if set, also stops once the 95% confidence interval of the house edge
+                is within +/- target_half_width (e.g. 0.001 for +/- 0.1%), checked every check_every rounds.
+            check_every (int): no. of rounds between checks of the confidence interval.
+        """
+        game, stats, played = self.game, self.stats, 0
+        start = time.perf_counter()
+        while played < n_rounds and game.has_chips():
+            self.play_round()
+            stats.update_game(game)
+            played += 1
+            if target_half_width is not None and played % check_every == 0 and stats.is_precise(target_half_width):
+                break
+        elapsed = time.perf_counter() - start
+        self.elapsed += elapsed
+        return played / elapsed if elapsed > 0 else 0.0
+
+    def rounds_per_second(self):
+        """Returns the average throughput of all rounds played so far."""
+        return self.game.rounds / self.elapsed if self.elapsed > 0 else 0.0
+
+    def results(self):
+        """Returns a dictionary of all game and chip counters (as shown by display_statistics())."""
+        game, chips = self.game, self.game.player_chips
+        return {
+            "rounds": game.rounds,
+            "player_wins": game.player_wins,
+            "blackjacks": game.blackjacks,
+            "pushes": game.pushes,
+            "busts": game.busts,
+            "starting_chips": game.starting_chips,
+            "total": chips.total,
+            "total_bets": chips.total_bets,
+            "winnings": chips.winnings,
+            "losses": chips.losses,
+            "biggest_bet_won": chips.biggest_bet_won,
+            "biggest_bet_loss": chips.biggest_bet_loss,
+            "elapsed": self.elapsed,
+            "stats": self.stats,
+        }
+
+    def report(self):
+        """Displays the game statistics table followed by the simulation throughput."""
+        self.game.display_statistics()
+        self.stats.display()
+        print(f"\n{self.game.rounds} rounds simulated in {self.elapsed:.2f}s ({self.rounds_per_second():,.0f} rounds/s)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run a headless Blackjack simulation.")
+    parser.add_argument("--rounds", type=int, default=100_000, help="number of rounds to simulate")
+    parser.add_argument("--chips", type=int, default=1_000_000, help="starting chips of the simulated player")
+    parser.add_argument("--decks", type=int, default=None, help="number of decks in a shoe (single deck per round if unset)")
+    parser.add_argument("--penetration", type=float, default=0.75, help="fraction of the shoe dealt before reshuffling")
+    parser.add_argument("--log", type=str, default=None, help="path of a binary log file recording every round")
+    parser.add_argument("--precision", type=float, default=None, help="stop once the house edge is known to +/- this")
+    parser.add_argument("--spread", type=int, default=None, help="bet 1 to spread chips by the Hi-Lo true count")
+    parser.add_argument("--profile", action="store_true", help="time and count each game phase")
+    parser.add_argument("--trace", type=str, default=None, help="path of a Chrome trace JSON file of each phase call")
+    args = parser.parse_args()
+
+    shoe = Shoe(args.decks, args.penetration) if args.decks else None
+    recorder = RoundRecorder(args.log) if args.log else None
+    sim = Simulator(args.chips, deck=shoe, recorder=recorder)
+    if args.spread:
+        CardCounter(sim.game.deck)
+        sim.bet_strategy = CountBetPolicy(spread=args.spread)
+    profiler = Profiler(trace=args.trace is not None).attach(sim.game) if args.profile or args.trace else None
+    sim.run(args.rounds, args.precision)
+    if recorder is not None:
+        recorder.close()
+    sim.report()
+    if profiler is not None:
+        profiler.display_summary()
+        if args.trace:
+            profiler.export_trace(args.trace)
@@ -0,0 +1,167 @@
+import random
+import struct
+from card_handling import Deck, Shoe, FULL_DECK
+from gameplay import Blackjack, PLAYER_BUST
+from playing_cards import dealer_stands_h17, ranks
+from counting import CardCounter
+from simulation import Simulator
+
+SIGNATURE, VERSION = b"BJSS", 3     # file signature, followed by a format version byte
+COUNTERS = struct.Struct("<13qb?")  # chips counters, round statistics, last outcome (-1 if none) and dealer rule
+SHOE = struct.Struct("<BHH")        # no. of decks, cut card and position of a shoe
+HAND = struct.Struct("<BB")         # no. of cards and state of a hand (see Hand class)
+RNG_STATE = struct.Struct("<B625Id")    # version, Mersenne Twister state and next gaussian (NaN if none)
+COUNTER = struct.Struct(f"<{len(ranks)}bq")  # weight of each rank and running count of an attached CardCounter
+
+
+def dump_game(game):
+    """
+    Serializes the full state of a Blackjack game to a compact binary snapshot: the deck or shoe (cards in
+    dealing order, as card codes), its random generator's state (if it has its own generator), the running
+    count of an attached card counter, both hands, the chips counters, the round statistics and the dealer's
+    soft 17 rule.
+    """
+    chips = game.player_chips
+    data = [SIGNATURE, bytes([VERSION]), COUNTERS.pack(
+        chips.total, chips.current_bet, chips.total_bets, chips.winnings, chips.losses, chips.biggest_bet_won,
+        chips.biggest_bet_loss, game.starting_chips, game.rounds, game.player_wins, game.blackjacks, game.pushes,
+        game.busts, -1 if game.outcome is None else game.outcome, game.dealer_stands is dealer_stands_h17
+    )]
+
+    deck = game.deck
+    if isinstance(deck, Shoe):
+        data.append(b"S" + SHOE.pack(deck.num_decks, deck.cut_card, deck.position))
+    else:
+        data.append(b"D" + struct.pack("<H", len(deck.cards)))
+    data.append(bytes(card.code for card in deck.cards))
+
+    if isinstance(deck.rng, random.Random):
+        version, state, gauss_next = deck.rng.getstate()
+        data.append(b"R" + RNG_STATE.pack(version, *state, float("nan") if gauss_next is None else gauss_next))
+    else:   # the global random module is not part of the game's state
+        data.append(b"-")
+
+    counter = getattr(deck, "counter", None)
+    if counter is not None:
+        data.append(b"C" + COUNTER.pack(*counter.card_weights[:len(ranks)], counter.running_count))
+    else:
+        data.append(b"-")
+
+    for hand in (game.hands["dealer"], game.hands["player"]):
+        data.append(HAND.pack(len(hand.cards), hand.state))
+        data.append(bytes(card.code for card in hand.cards))
+    return b"".join(data)
+
+
+def load_game(data, verbose=True, output=print, prompt=input):
+    """Restores a Blackjack game from a snapshot made by dump_game(), to resume playing from the same state."""
+    if not data.startswith(SIGNATURE):
+        raise ValueError("Error: not a Blackjack snapshot.")
+    version = data[len(SIGNATURE)] if len(data) > len(SIGNATURE) else None
+    if version != VERSION:
+        raise ValueError(f"Error: unsupported snapshot format version {version} (expected {VERSION}).")
+    offset = len(SIGNATURE) + 1
+
+    def read(n):
+        nonlocal offset
+        offset += n
+        return data[offset - n:offset]
+
+    counters = COUNTERS.unpack(read(COUNTERS.size))
+
+    if read(1) == b"S":
+        num_decks, cut_card, position = SHOE.unpack(read(SHOE.size))
+        deck = Shoe(num_decks)
+        deck.cut_card, deck.position = cut_card, position
+        size = len(deck.cards)
+    else:
+        deck = Deck()
+        size, = struct.unpack("<H", read(2))
+    deck.cards = [FULL_DECK[code] for code in read(size)]
+
+    if read(1) == b"R":
+        version, *state, gauss_next = RNG_STATE.unpack(read(RNG_STATE.size))
+        deck.rng = random.Random()
+        deck.rng.setstate((version, tuple(state), None if gauss_next != gauss_next else gauss_next))
+
+    if read(1) == b"C":
+        *weights, running_count = COUNTER.unpack(read(COUNTER.size))
+        CardCounter(deck, weights).running_count = running_count
+
+    game = Blackjack(counters[7], verbose, deck, output, prompt, hit_soft_17=counters[14])
+    for hand in (game.hands["dealer"], game.hands["player"]):
+        n_cards, hand.state = HAND.unpack(read(HAND.size))
+        hand.cards = [FULL_DECK[code] for code in read(n_cards)]
+    if isinstance(deck, Shoe):     # the cards of the current (or last) round are the ones in play
+        deck.round_start = max(0, deck.position - sum(len(hand.cards) for hand in game.hands.values()))
+
+    chips = game.player_chips
+    (chips.total, chips.current_bet, chips.total_bets, chips.winnings, chips.losses, chips.biggest_bet_won,
+     chips.biggest_bet_loss) = counters[:7]
+    game.rounds, game.player_wins, game.blackjacks, game.pushes, game.busts = counters[8:13]
+    game.outcome = None if counters[13] == -1 else counters[13]
+    return game
+
+
+def save_snapshot(game, path):
+    """Saves a snapshot of a game to a binary file (checkpoint)."""
+    with open(path, "wb") as f:
+        f.write(dump_game(game))
+
+
+def load_snapshot(path, **kwargs):
+    """Restores a game from a binary snapshot file (restart) - see load_game() for keyword arguments."""
+    with open(path, "rb") as f:
+        return load_game(f.read(), **kwargs)
+
+
+class ActionRecorder:
+    """
+    Records the bet and actions of every round of a game, to replay the session with replay(). Set as the
+    recorder attribute of a Blackjack object (see end_round() in gameplay.py), alongside a seeded deck.
+
+    attributes:
+        rounds (list): (bet, actions) of each round, where actions is a string of "h" (hit) and "s" (stand).
+    """
+
+    def __init__(self):
+        self.rounds = []
+
+    def record(self, game):
+        """Records the round just finished: hits are the cards drawn after the first deal, then a stand."""
+        hits = "h" * (len(game.hands["player"].cards) - 2)
+        self.rounds.append((game.player_chips.current_bet, hits if game.outcome == PLAYER_BUST else hits + "s"))
+
+
+def replay(seed, rounds, starting_chips, num_decks=None, penetration=0.75, hit_soft_17=False):
+    """
+    Re-runs a recorded session without any I/O, from the seed of the deck's random generator and the list of
+    (bet, actions) of each round, played by Simulator.play_round() with scripted bet and play strategies. Returns
+    the replayed game and the (outcome, chips total) after each round, to verify another engine round by round
+    against this reference implementation (with the same soft 17 rule).
+    """
+    rng = random.Random(seed)
+    deck = Shoe(num_decks, penetration, rng) if num_decks else Deck(rng)
+    script = iter(rounds)
+    actions = iter(())
+
+    def scripted_bet(game):
+        """Returns the recorded bet of the next round, which must be valid (play_round() would clamp it)."""
+        nonlocal actions
+        bet, round_actions = next(script)
+        error = game.bet_error(bet)
+        if error:
+            raise ValueError(f"{error} (round {game.rounds + 1})")
+        actions = iter(round_actions)
+        return bet
+
+    def scripted_play(player_hand, dealer_upcard):
+        """Returns the next recorded action of the round, standing once they run out."""
+        return next(actions, "s")
+
+    sim = Simulator(starting_chips, scripted_bet, scripted_play, deck, hit_soft_17=hit_soft_17)
+    results = []
+    for _ in rounds:
+        sim.play_round()
+        results.append((sim.game.outcome, sim.game.player_chips.total))
+    return sim.game, results
@@ -0,0 +1,150 @@
+import os
+from array import array
+from functools import lru_cache
+from probability import OUTCOMES, CARD_VALUES, full_composition, remove_card, dealer_probabilities
+from playing_cards import dealer_stands_h17
+
+TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "strategy_table.bin")
+TABLE_PATH_H17 = os.path.join(os.path.dirname(os.path.abspath(__file__)), "strategy_table_h17.bin")  # dealer hits soft 17
+SOFT, TOTALS, UPCARDS = 2, 22, 12     # table dimensions, indexed by [soft][player total][dealer upcard value]
+
+
+class StrategyTable:
+    """
+    Represents the expected values of standing and hitting for every (player total, soft/hard, dealer upcard)
+    state under the current game rules: no splitting or doubling, 1:1 payouts and a dealer standing on all 17s
+    (or hitting soft 17, see compute()).
+
+    The table is total-dependent: the player's cards are not known from a (total, soft/hard) state, so every
+    card the player draws is taken from the same composition (the full shoe less the dealer's upcard), as if
+    drawn from an infinite shoe of that composition. The approximation is exact for an infinite shoe and
+    improves with the no. of decks (removing each drawn card would need a composition-dependent table).
+    """
+
+    def __init__(self, stand_evs, hit_evs):
+        """
+        args:
+            stand_evs (array): flat array of expected values (per chip bet) of standing in each state.
+            hit_evs (array): flat array of expected values (per chip bet) of hitting in each state.
+        """
+        self.stand_evs = stand_evs
+        self.hit_evs = hit_evs
+
+    @staticmethod
+    def index(total, soft, upcard):
+        """Returns the flat table index of a (player total, soft flag, dealer upcard value) state."""
+        return (int(soft) * TOTALS + total) * UPCARDS + upcard
+
+    @classmethod
+    def compute(cls, num_decks=1, hit_soft_17=False):
+        """
+        Computes the table with dynamic programming. Standing is valued with the exact dealer outcome
+        probabilities (see probability.py) under the dealer's soft 17 rule, and hitting recursively takes the
+        best of standing or hitting again after each possible card, drawn from the shoe composition less the
+        dealer's upcard (without removing the cards drawn, see the infinite shoe approximation above).
+
+        args:
+            num_decks (int): no. of decks of the shoe composition.
+            hit_soft_17 (bool): if True, the dealer hits a soft 17 (see dealer_stands_h17 in playing_cards.py).
+        """
+        size = SOFT * TOTALS * UPCARDS
+        stand_evs, hit_evs = array("f", [0.0]) * size, array("f", [0.0]) * size
+
+        for upcard in CARD_VALUES:
+            composition = remove_card(full_composition(num_decks), upcard)
+            dealer = dict(zip(OUTCOMES, dealer_probabilities(upcard, composition, hit_soft_17)))
+            n = sum(composition)
+
+            def stand(total):
+                if total > 21:
+                    return -1.0
+                win = dealer["bust"] + sum(p for outcome, p in dealer.items() if outcome != "bust" and int(outcome) < total)
+                loss = sum(p for outcome, p in dealer.items() if outcome != "bust" and int(outcome) > total)
+                return win - loss
+
+            @lru_cache(maxsize=None)
+            def hit(total, aces):
+                ev = 0.0
+                for value, count in zip(CARD_VALUES, composition):     # same composition at every draw
+                    new_total, new_aces = total + value, aces + (value == 11)
+                    while new_aces > 0 and new_total > 21:     # see next_hand_state() in playing_cards.py
+                        new_total -= 10
+                        new_aces -= 1
+                    best = -1.0 if new_total > 21 else max(stand(new_total), hit(new_total, new_aces))
+                    ev += count / n * best
+                return ev
+
+            for total in range(4, 22):
+                for soft in (False, True):
+                    if soft and total < 12:     # a soft hand counts an ace as 11
+                        continue
+                    i = cls.index(total, soft, upcard)
+                    stand_evs[i], hit_evs[i] = stand(total), hit(total, int(soft))
+        return cls(stand_evs, hit_evs)
+
+    @classmethod
+    def load(cls, path=TABLE_PATH):
+        """Loads a table saved with save() from a binary file of float32 values."""
+        size = SOFT * TOTALS * UPCARDS
+        evs = array("f")
+        with open(path, "rb") as f:
+            evs.fromfile(f, 2 * size)
+        return cls(evs[:size], evs[size:])
+
+    def save(self, path=TABLE_PATH):
+        """Saves the table as a compact binary file of float32 values (stand values followed by hit values)."""
+        with open(path, "wb") as f:
+            self.stand_evs.tofile(f)
+            self.hit_evs.tofile(f)
+
+    def expected_values(self, total, soft, upcard):
+        """Returns the expected values (stand, hit) per chip bet of a given state."""
+        i = self.index(total, soft, upcard)
+        return self.stand_evs[i], self.hit_evs[i]
+
+    def best_action(self, total, soft, upcard):
+        """Returns the optimal action of a given state: "h" (hit) or "s" (stand)."""
+        if total > 21:
+            return "s"
+        i = self.index(total, soft, upcard)
+        return "h" if self.hit_evs[i] > self.stand_evs[i] else "s"
+
+    def __call__(self, player_hand, dealer_upcard):
+        """Hit/stand strategy for the Simulator class (see simulation.py), based on the optimal action."""
+        return self.best_action(player_hand.value, player_hand.aces > 0, dealer_upcard.value)
+
+    def hit_table(self):
+        """Returns the optimal actions as a (2, 32, 12) boolean array of hits for the engine in vectorized.py."""
+        import numpy as np
+        table = np.zeros((SOFT, 32, UPCARDS), dtype=bool)
+        table[:, :TOTALS, :] = (
+            np.frombuffer(self.hit_evs, dtype=np.float32) > np.frombuffer(self.stand_evs, dtype=np.float32)
+        ).reshape(SOFT, TOTALS, UPCARDS)
+        return table
+
+
+def load_strategy(path=None, hit_soft_17=False):
+    """
+    Loads the strategy table of a dealer soft 17 rule from disk, computing and saving it first if the file does
+    not exist (TABLE_PATH, or TABLE_PATH_H17 if the dealer hits soft 17, by default).
+    """
+    if path is None:
+        path = TABLE_PATH_H17 if hit_soft_17 else TABLE_PATH
+    if not os.path.exists(path):
+        StrategyTable.compute(hit_soft_17=hit_soft_17).save(path)
+    return StrategyTable.load(path)
+
+
+def game_strategy(game):
+    """Loads the strategy table matching the dealer's soft 17 rule of a Blackjack game object (see gameplay.py)."""
+    return load_strategy(hit_soft_17=game.dealer_stands is dealer_stands_h17)
+
+
+if __name__ == "__main__":
+    import sys
+    strategy = load_strategy(hit_soft_17="--h17" in sys.argv[1:])
+    print("       " + "".join(("A" if upcard == 11 else str(upcard)).rjust(3) for upcard in CARD_VALUES))
+    for soft, totals in ((False, range(4, 22)), (True, range(12, 22))):
+        for total in totals:
+            label = f"{'soft' if soft else 'hard'} {total}"
+            print(label.ljust(7) + "".join(strategy.best_action(total, soft, upcard).upper().rjust(3) for upcard in CARD_VALUES))
@@ -0,0 +1,173 @@
+import math
+from statistics import NormalDist
+from gameplay import WIDTH, CHAR, LOSS, WIN, PUSH, PLAYER_BUST, DEALER_BUST
+
+OUTCOME_NAMES = {LOSS: "Losses", WIN: "Wins", PUSH: "Pushes", PLAYER_BUST: "Player busts", DEALER_BUST: "Dealer busts"}
+OUTCOME_SIGNS = {LOSS: -1, WIN: 1, PUSH: 0, PLAYER_BUST: -1, DEALER_BUST: 1}   # chips won per chip bet
+
+
+class RunningStats:
+    """
+    Accumulates round statistics in O(1) memory: running mean and variance of the return per chip bet
+    (weighted Welford's algorithm, each round weighted by its bet so the mean is the total chips won over the
+    total chips bet), outcome frequencies and an approximate histogram of the bankroll. Accumulators from
+    separate runs or worker processes can be merged, giving the same result as a single run.
+    """
+
+    def __init__(self, bucket_width=1, max_buckets=1024):
+        """
+        args:
+            bucket_width (int): initial width (in chips) of the bankroll histogram buckets.
+            max_buckets (int): maximum no. of histogram buckets - the width is doubled whenever it is exceeded.
+
+        attributes:
+            n (int): no. of rounds accumulated.
+            total_bet (int): sum of the bets (weights) of all rounds.
+            mean (float): mean return per chip bet of all rounds (total chips won / total chips bet).
+            m2 (float): sum of the bet-weighted squared deviations from the mean.
+            sq_weights (int): sum of the squared bets, with sq_mean and sq_m2 the mean and sum of squared
+                deviations weighted by the squared bets (for the standard error of the mean, see standard_error()).
+            outcomes (dict): no. of rounds for each round outcome (see gameplay.py).
+            buckets (dict): no. of rounds ending with a bankroll in each bucket, keyed by bankroll // bucket_width.
+        """
+        self.n = 0
+        self.total_bet = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.sq_weights = 0
+        self.sq_mean = 0.0
+        self.sq_m2 = 0.0
+        self.outcomes = dict.fromkeys(OUTCOME_NAMES, 0)
+        self.bucket_width = bucket_width
+        self.max_buckets = max_buckets
+        self.buckets = {}
+
+    def update(self, round_return, outcome, bankroll, bet=1):
+        """
+        Adds a single round to the accumulator.
+
+        args:
+            round_return (float): chips won (positive) or lost (negative) per chip bet in the round.
+            outcome (int): outcome of the round (LOSS, WIN, PUSH, PLAYER_BUST or DEALER_BUST).
+            bankroll (int): player's chips at the end of the round.
+            bet (int): chips bet in the round, weighting its return.
+        """
+        self.n += 1
+        if bet > 0:
+            self.total_bet += bet
+            delta = round_return - self.mean
+            self.mean += delta * bet / self.total_bet
+            self.m2 += bet * delta * (round_return - self.mean)
+            self.sq_weights += bet ** 2
+            delta = round_return - self.sq_mean
+            self.sq_mean += delta * bet ** 2 / self.sq_weights
+            self.sq_m2 += bet ** 2 * delta * (round_return - self.sq_mean)
+        self.outcomes[outcome] += 1
+        bucket = bankroll // self.bucket_width
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+        if len(self.buckets) > self.max_buckets:
+            self._coarsen(self.bucket_width * 2)
+
+    def update_game(self, game):
+        """Adds the round just finished by a Blackjack game object (see gameplay.py), weighted by its bet."""
+        chips = game.player_chips
+        self.update(OUTCOME_SIGNS[game.outcome], game.outcome, chips.total, chips.current_bet)
+
+    def _coarsen(self, bucket_width):
+        """Merges the histogram buckets into wider buckets (a multiple of the current width)."""
+        buckets = {}
+        for bucket, count in self.buckets.items():
+            wider = bucket * self.bucket_width // bucket_width
+            buckets[wider] = buckets.get(wider, 0) + count
+        self.buckets, self.bucket_width = buckets, bucket_width
+
+    def merge(self, other):
+        """Merges another accumulator into this one (in-place) and returns it."""
+        if other.n == 0:
+            return self
+        self.n += other.n
+        if other.total_bet > 0:
+            total_bet = self.total_bet + other.total_bet
+            delta = other.mean - self.mean
+            self.mean += delta * other.total_bet / total_bet
+            self.m2 += other.m2 + delta ** 2 * self.total_bet * other.total_bet / total_bet
+            self.total_bet = total_bet
+            sq_weights = self.sq_weights + other.sq_weights
+            delta = other.sq_mean - self.sq_mean
+            self.sq_mean += delta * other.sq_weights / sq_weights
+            self.sq_m2 += other.sq_m2 + delta ** 2 * self.sq_weights * other.sq_weights / sq_weights
+            self.sq_weights = sq_weights
+        for outcome, count in other.outcomes.items():
+            self.outcomes[outcome] += count
+
+        width = max(self.bucket_width, other.bucket_width)
+        if width % self.bucket_width or width % other.bucket_width:
+            raise ValueError("Error: bankroll bucket widths must be multiples of each other to merge.")
+        if width != self.bucket_width:
+            self._coarsen(width)
+        for bucket, count in other.buckets.items():
+            wider = bucket * other.bucket_width // width
+            self.buckets[wider] = self.buckets.get(wider, 0) + count
+        while len(self.buckets) > self.max_buckets:
+            self._coarsen(self.bucket_width * 2)
+        return self
+
+    def variance(self):
+        """Returns the (bet-weighted) sample variance of the return per chip bet."""
+        return self.m2 / self.total_bet * self.n / (self.n - 1) if self.n > 1 and self.total_bet > 0 else 0.0
+
+    def standard_error(self):
+        """
+        Returns the standard error of the mean return per chip bet, a ratio of total chips won to total chips
+        bet: sqrt(sum(bet^2 * (return - mean)^2)) / total_bet, with the sum split into the squared-bet weighted
+        deviations and the offset of their mean. Equal to sqrt(variance() / n) with flat bets.
+        """
+        if self.n < 2 or self.total_bet == 0:
+            return math.inf
+        deviations = self.sq_m2 + self.sq_weights * (self.sq_mean - self.mean) ** 2
+        return math.sqrt(deviations * self.n / (self.n - 1)) / self.total_bet
+
+    def house_edge(self):
+        """Returns the estimated house edge: the expected fraction of each chip bet lost by the player."""
+        return -self.mean
+
+    def confidence_interval(self, level=0.95):
+        """Returns the (lower, upper) bounds of a normal confidence interval of the house edge."""
+        half_width = NormalDist().inv_cdf(0.5 + level / 2) * self.standard_error()
+        return self.house_edge() - half_width, self.house_edge() + half_width
+
+    def is_precise(self, half_width, level=0.95):
+        """Returns True once the confidence interval of the house edge is within +/- half_width."""
+        return NormalDist().inv_cdf(0.5 + level / 2) * self.standard_error() <= half_width
+
+    def quantile(self, q):
+        """Returns the approximate q-quantile (0 to 1) of the bankroll, to within one bucket width."""
+        if self.n == 0:
+            return None
+        target, cumulative = q * self.n, 0
+        for bucket in sorted(self.buckets):
+            cumulative += self.buckets[bucket]
+            if cumulative >= target:
+                return bucket * self.bucket_width
+        return max(self.buckets) * self.bucket_width
+
+    def display(self, level=0.95):
+        """Displays a table of the house edge with its confidence interval, outcome frequencies and bankroll quantiles."""
+        if self.n == 0:
+            return
+        lower, upper = self.confidence_interval(level)
+        print("\n" + "".center(WIDTH, CHAR))
+        print(f"***  HOUSE EDGE  ***".center(WIDTH, CHAR))
+        print("" + "".center(WIDTH, CHAR))
+        print(f"{CHAR * 2}| Rounds: {self.n} |".ljust(WIDTH, CHAR))
+        print(f"{CHAR * 2}| House edge: {self.house_edge() * 100:.3f}% |".ljust(WIDTH, CHAR))
+        print(f"{CHAR * 2}| {level * 100:.0f}% CI: [{lower * 100:.3f}%, {upper * 100:.3f}%] |".ljust(WIDTH, CHAR))
+        print(f"{CHAR * 2}| Std. dev. per chip bet: {math.sqrt(self.variance()):.4f} |".ljust(WIDTH, CHAR))
+        print("".center(WIDTH, CHAR))
+        for outcome, name in OUTCOME_NAMES.items():
+            count = self.outcomes[outcome]
+            print(f"{CHAR * 2}| {name}: {count} ({count / self.n * 100:.2f}%) |".ljust(WIDTH, CHAR))
+        print("".center(WIDTH, CHAR))
+        for q in (0.05, 0.25, 0.5, 0.75, 0.95):
+            print(f"{CHAR * 2}| Bankroll {q * 100:.0f}th percentile: ~{self.quantile(q)} |".ljust(WIDTH, CHAR))
+        print("" + "".center(WIDTH, CHAR))
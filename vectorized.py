@@ -0,0 +1,133 @@
+import time
+import argparse
+import numpy as np
+from playing_cards import card_values, hand_transitions, hand_busts, dealer_stands_s17, dealer_stands_h17
+from gameplay import LOSS, WIN, PUSH, PLAYER_BUST, DEALER_BUST   # round outcomes returned by play_rounds()
+
+# card values of a full deck, in the same order as Deck.reinstate_deck():
+DECK_VALUES = np.array(card_values, dtype=np.int8)
+
+# hand state lookups (see next_hand_state() in playing_cards.py), where a state is soft flag * 32 + total:
+TRANSITIONS = np.array(hand_transitions, dtype=np.int8)     # indexed by [state, card value]
+BUSTS = np.array(hand_busts)
+STANDS_S17 = np.array(dealer_stands_s17)
+STANDS_H17 = np.array(dealer_stands_h17)
+
+
+def hit_below_table(threshold=17):
+    """
+    Returns a fixed strategy table of shape (2, 32, 12) indexed by [soft, hand total, dealer upcard value],
+    where True means hit. This table hits on any total below the threshold (i.e. the dealer's own rule).
+    """
+    table = np.zeros((2, 32, 12), dtype=bool)
+    table[:, :threshold, :] = True
+    return table
+
+
+def shuffled_decks(n, rng):
+    """Returns an (n, 52) array of card values, each row being an independently shuffled deck."""
+    return rng.permuted(np.broadcast_to(DECK_VALUES, (n, DECK_VALUES.size)), axis=1)
+
+
+def draw(decks, positions, states, idx):
+    """
+    Draws the next card of each selected round's deck into its hand (see Hand.draw_card()), advancing the
+    hand states with a single lookup of the transition table. All arrays are updated in-place.
+
+    args:
+        decks (np.ndarray): (n, 52) array of shuffled card values.
+        positions (np.ndarray): index of the next card to deal for each round's deck.
+        states (np.ndarray): hand state (soft flag * 32 + total) for each round.
+        idx (np.ndarray): indices of the rounds drawing a card.
+    """
+    cards = decks[idx, positions[idx]]
+    positions[idx] += 1
+    states[idx] = TRANSITIONS[states[idx], cards]
+
+
+def play_rounds(n_rounds, bets=1, strategy=None, rng=None, hit_soft_17=False):
+    """
+    Plays n_rounds independent rounds in lockstep, one game phase at a time: first deal, player's turn
+    (following a fixed strategy table) and dealer's turn (standing on 17), before resolving all rounds.
+    Each round uses a freshly shuffled 52-card deck, as in Blackjack.handle_deck().
+
+    args:
+        n_rounds (int): number of rounds to play.
+        bets (int or np.ndarray): bet for every round, or an array of bets for each round.
+        strategy (np.ndarray): (2, 32, 12) hit/stand table - see hit_below_table() (default).
+        rng (np.random.Generator): random generator used to shuffle the decks.
+        hit_soft_17 (bool): if True, the dealer hits a soft 17 instead of standing on all 17s.
+
+    returns:
+        outcomes (np.ndarray): outcome of each round (LOSS, WIN, PUSH, PLAYER_BUST or DEALER_BUST).
+        deltas (np.ndarray): chips won (positive) or lost (negative) in each round.
+    """
+    strategy = (hit_below_table() if strategy is None else strategy).reshape(64, 12)    # indexed by [state, upcard]
+    strategy = strategy & ~BUSTS[:, None]   # busted hands never hit
+    stands = STANDS_H17 if hit_soft_17 else STANDS_S17
+    rng = np.random.default_rng() if rng is None else rng
+    decks = shuffled_decks(n_rounds, rng)
+    positions = np.full(n_rounds, 4, dtype=np.intp)
+    everyone = np.arange(n_rounds)
+
+    # ====== FIRST DEAL ====== #
+    # cards are dealt alternately to the dealer and player, as in Blackjack.first_deal():
+    dealer_state = TRANSITIONS[TRANSITIONS[0, decks[:, 0]], decks[:, 2]]
+    player_state = TRANSITIONS[TRANSITIONS[0, decks[:, 1]], decks[:, 3]]
+    upcard = decks[:, 2]    # dealer's second card is shown
+
+    # ====== PLAYER'S TURN ====== #
+    hitting = everyone[strategy[player_state, upcard]]
+    while hitting.size:
+        draw(decks, positions, player_state, hitting)
+        hitting = hitting[strategy[player_state[hitting], upcard[hitting]]]
+    player_total = player_state & 31
+    player_busted = player_total > 21
+
+    # ====== DEALER'S TURN ====== #
+    drawing = everyone[~player_busted & ~stands[dealer_state]]
+    while drawing.size:
+        draw(decks, positions, dealer_state, drawing)
+        drawing = drawing[~stands[dealer_state[drawing]]]
+    dealer_total = dealer_state & 31
+
+    # ====== RESOLUTION ====== #
+    outcomes = np.select(
+        [player_busted, dealer_total > 21, player_total > dealer_total, player_total == dealer_total],
+        [PLAYER_BUST, DEALER_BUST, WIN, PUSH],
+        default=LOSS
+    ).astype(np.int8)
+    signs = np.array([-1, 1, 0, -1, 1], dtype=np.int64)    # indexed by outcome
+    deltas = signs[outcomes] * bets
+    return outcomes, deltas
+
+
+def simulate(n_rounds, bet=1, strategy=None, seed=None, chunk_size=100_000):
+    """
+    Plays n_rounds flat-bet rounds with play_rounds() in chunks of bounded memory.
+    Returns the concatenated outcomes and chip deltas of all rounds.
+    """
+    rng = np.random.default_rng(seed)
+    outcomes, deltas = [], []
+    for start in range(0, n_rounds, chunk_size):
+        o, d = play_rounds(min(chunk_size, n_rounds - start), bet, strategy, rng)
+        outcomes.append(o)
+        deltas.append(d)
+    return np.concatenate(outcomes), np.concatenate(deltas)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run a vectorized Blackjack simulation.")
+    parser.add_argument("--rounds", type=int, default=1_000_000, help="number of rounds to simulate")
+    parser.add_argument("--seed", type=int, default=None, help="seed of the random generator")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    outcomes, deltas = simulate(args.rounds, seed=args.seed)
+    elapsed = time.perf_counter() - start
+
+    counts = np.bincount(outcomes, minlength=5)
+    for name, outcome in zip(["Losses", "Wins", "Pushes", "Player busts", "Dealer busts"], range(5)):
+        print(f"{name}: {counts[outcome]} ({counts[outcome] / args.rounds * 100:.2f}%)")
+    print(f"House edge: {-deltas.mean() * 100:.3f}%")
+    print(f"\n{args.rounds} rounds simulated in {elapsed:.2f}s ({args.rounds / elapsed:,.0f} rounds/s)")